@@ -279,7 +279,7 @@ def generate_report(
 
         # Step 3: Generate visualizations
         print(f"{Fore.GREEN}[3/4] Creating visualizations...{Style.RESET_ALL}")
-        visualizer = CURVisualizer()
+        visualizer = CURVisualizer(keep_charts=False)
 
         # Generate 9 charts (all with monthly context)
         with tqdm(
@@ -340,8 +340,10 @@ def generate_report(
         # Generate HTML report
         if generate_html:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            html_path = os.path.join(output_dir, f"cur_report_{timestamp}.html")
-            visualizer.generate_html_report(html_path, summary_stats)
+            (html_path,) = visualizer.write_reports(
+                [(f"cur_report_{timestamp}.html", summary_stats, "AWS Cost and Usage Report")],
+                output_dir,
+            )
             output_files.append(html_path)
             print(f"{Fore.GREEN}✓ HTML report: {html_path}{Style.RESET_ALL}")
 
@@ -5,17 +5,481 @@ import logging
 import math
 import os
 import re
+import string
 from datetime import datetime
-from typing import Any, List
+from typing import Any, Callable, Iterable, List, Tuple
 
+import numpy as np
 import pandas as pd
+from jinja2 import ChoiceLoader, DictLoader
 from pyecharts import options as opts
 from pyecharts.charts import Bar, HeatMap, Line, Page, Scatter
 from pyecharts.commons.utils import JsCode
-from pyecharts.globals import ThemeType
+from pyecharts.globals import CurrentConfig, ThemeType
 
 logger = logging.getLogger(__name__)
 
+# Summary values produced by the data processor (ISO dates, "N/A") only ever use
+# these characters, so they can be emitted verbatim without an html.escape pass.
+_PLAIN_TEXT_RE = re.compile(r"[\w\s:./-]*", re.ASCII)
+
+# ECharts locale used for every chart (pyecharts defaults to ZH)
+_CHART_LOCALE = "EN"
+
+# Body-only page template for the charts: the report supplies its own <html>/<head>, so
+# pyecharts renders just the chart containers and scripts using its bundled macros.
+_CHART_TEMPLATE_NAME = "cur_report_charts.html"
+_CHART_TEMPLATE = """{% import 'macro' as macro %}
+<style>.box { {{ chart.layout }} } </style>
+<div class="box">
+    {% for c in chart %}
+        {{ macro.render_chart_content(c) }}
+        {% for _ in range(chart.page_interval) %}
+            {% if chart.remove_br is false %}<br/>{% endif %}
+        {% endfor %}
+    {% endfor %}
+</div>
+<script>
+    {% for js in chart.js_functions.items %}
+        {{ js }}
+    {% endfor %}
+</script>
+"""
+_CHART_TEMPLATE_ENV = CurrentConfig.GLOBAL_ENV.overlay(
+    loader=ChoiceLoader(
+        [DictLoader({_CHART_TEMPLATE_NAME: _CHART_TEMPLATE}), CurrentConfig.GLOBAL_ENV.loader]
+    )
+)
+
+# Write buffer for HTML reports, large enough to hold a typical report in one syscall
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+# Default series palette shared by the trend charts
+_PALETTE = (
+    "#5470c6",
+    "#91cc75",
+    "#fac858",
+    "#ee6666",
+    "#73c0de",
+    "#3ba272",
+    "#fc8452",
+    "#9a60b4",
+)
+
+# Anomaly palette, leading with red so the first service stands out
+_ANOMALY_PALETTE = (
+    "#ee6666",
+    "#fac858",
+    "#91cc75",
+    "#73c0de",
+    "#5470c6",
+    "#9a60b4",
+    "#fc8452",
+    "#3ba272",
+)
+
+# Discount palettes, leading with green for savings
+_DISCOUNT_PALETTE = (
+    "#91cc75",
+    "#5470c6",
+    "#fac858",
+    "#ee6666",
+    "#73c0de",
+    "#3ba272",
+    "#fc8452",
+    "#9a60b4",
+)
+_DISCOUNT_TYPE_PALETTE = ("#91cc75", "#5470c6", "#ee6666", "#fac858", "#73c0de")
+# Heatmap colour scale from $0 to the largest cell
+_HEATMAP_RANGE_COLORS = ("#eef5ff", "#5470c6")
+
+# Anomaly marker sizes by |z-score| bucket: < 2.5, < 3 and >= 3
+_ANOMALY_SEVERITY_BINS = np.array([2.5, 3.0])
+_ANOMALY_SYMBOL_SIZES = np.array([12, 16, 20], dtype=np.int32)
+
+# Most points drawn per anomaly series; beyond this only the largest deviations are kept
+_ANOMALY_MAX_POINTS = 5000
+
+# Toolbox shared by the charts; the trend charts also offer zoom and line/bar/stack switching
+_BASIC_TOOLBOX_OPTS = opts.ToolboxOpts(
+    is_show=True,
+    feature=opts.ToolBoxFeatureOpts(
+        save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
+        restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
+        data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
+    ),
+)
+_ZOOM_TOOLBOX_OPTS = opts.ToolboxOpts(
+    is_show=True,
+    feature=opts.ToolBoxFeatureOpts(
+        save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
+        restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
+        data_zoom=opts.ToolBoxFeatureDataZoomOpts(zoom_title="Zoom", back_title="Reset Zoom"),
+        data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
+    ),
+)
+_TREND_TOOLBOX_OPTS = opts.ToolboxOpts(
+    is_show=True,
+    feature=opts.ToolBoxFeatureOpts(
+        save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
+        restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
+        data_zoom=opts.ToolBoxFeatureDataZoomOpts(zoom_title="Zoom", back_title="Reset Zoom"),
+        data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
+        magic_type=opts.ToolBoxFeatureMagicTypeOpts(
+            line_title="Line", bar_title="Bar", stack_title="Stack"
+        ),
+    ),
+)
+
+# Tooltip text color, shared by every chart's tooltip
+_TOOLTIP_TEXTSTYLE = opts.TextStyleOpts(color="#ffffff")
+
+# Shared tooltip styling for all charts, kept on one line to keep the embedded JS small
+_TOOLTIP_STYLE = (
+    "background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); "
+    "border: none; "
+    "border-radius: 4px; "
+    "padding: 6px 10px; "
+    "box-shadow: none; "
+    "color: #ffffff; "
+    "font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; "
+    "font-size: 12px; "
+    "line-height: 1.4; "
+    "max-width: 200px; "
+    "white-space: normal;"
+)
+
+# Axis tooltip listing each series' cost for the hovered month
+_AXIS_COST_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var style = `{_TOOLTIP_STYLE}`;
+    var result = '<div style="' + style + '">';
+    result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
+    params.forEach(function(item) {{
+        result += '<div style="margin: 2px 0;">';
+        result += item.marker + ' ';
+        result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
+        result += '<strong>$' + item.value.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong>';
+        result += '</div>';
+    }});
+    result += '</div>';
+    return result;
+}}""")
+
+# Axis tooltip for account series, prefixing each series with "Account"
+_ACCOUNT_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var style = `{_TOOLTIP_STYLE}`;
+    var result = '<div style="' + style + '">';
+    result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
+    params.forEach(function(item) {{
+        result += '<div style="margin: 2px 0;">';
+        result += item.marker + ' ';
+        result += '<span style="opacity: 0.9;">Account ' + item.seriesName + ':</span> ';
+        result += '<strong>$' + item.value.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong>';
+        result += '</div>';
+    }});
+    result += '</div>';
+    return result;
+}}""")
+
+# Item tooltip for a single account/service heatmap cell
+_HEATMAP_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var style = `{_TOOLTIP_STYLE}`;
+    return '<div style="' + style + '">' +
+        '<strong style="font-size: 12px;">Cost Breakdown</strong><br/><br/>' +
+        '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Account: </span><strong>' + params.name + '</strong></div>' +
+        '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Service: </span><strong>' + params.value[0] + '</strong></div>' +
+        '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Total Cost: </span><strong>$' + params.value[2].toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong></div>' +
+        '</div>';
+}}""")
+
+# Item tooltip for an anomaly point: [month, cost, z_score, mean_cost, pct_change]
+_ANOMALY_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var value = params.value;
+    var style = `{_TOOLTIP_STYLE}`;
+    var result = '<div style="' + style + '">';
+    result += '<strong style="font-size: 12px;">' + params.seriesName + '</strong><br/><br/>';
+    result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Month: </span><strong>' + value[0] + '</strong></div>';
+    result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Cost: </span><strong>$' + value[1].toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong></div>';
+    result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Average: </span><strong>$' + value[3].toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong></div>';
+    result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Change: </span><strong style="color: ' + (value[4] > 0 ? '#ff6b6b' : '#51cf66') + ';">' + (value[4] > 0 ? '+' : '') + value[4].toFixed(1) + '%</strong></div>';
+    result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Z-Score: </span><strong>' + value[2].toFixed(2) + '</strong></div>';
+    result += '</div>';
+    return result;
+}}""")
+
+# Axis tooltip for discount series, with a total across all series
+_DISCOUNT_TOTAL_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var style = `{_TOOLTIP_STYLE}`;
+    var result = '<div style="' + style + '">';
+    result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
+    var total = 0;
+    params.forEach(function(item) {{
+        total += item.value;
+        result += '<div style="margin: 2px 0;">';
+        result += item.marker + ' ';
+        result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
+        result += '<strong style="color: #91cc75;">$' + item.value.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong>';
+        result += '</div>';
+    }});
+    result += '<hr style="margin: 4px 0; border-color: rgba(255,255,255,0.2);"/>';
+    result += '<div><strong>Total: $' + total.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong></div>';
+    result += '</div>';
+    return result;
+}}""")
+
+# Axis tooltip for discount series, highlighting amounts in green
+_DISCOUNT_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var style = `{_TOOLTIP_STYLE}`;
+    var result = '<div style="' + style + '">';
+    result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
+    params.forEach(function(item) {{
+        result += '<div style="margin: 2px 0;">';
+        result += item.marker + ' ';
+        result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
+        result += '<strong style="color: #91cc75;">$' + item.value.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong>';
+        result += '</div>';
+    }});
+    result += '</div>';
+    return result;
+}}""")
+
+# Axis tooltip for savings plan series, formatting "Savings %" as a percentage
+_SAVINGS_PLAN_TOOLTIP_JS = JsCode(f"""function(params) {{
+    var style = `{_TOOLTIP_STYLE}`;
+    var result = '<div style="' + style + '">';
+    result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
+    params.forEach(function(item) {{
+        result += '<div style="margin: 2px 0;">';
+        result += item.marker + ' ';
+        result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
+        if (item.seriesName === 'Savings %') {{
+            result += '<strong style="color: #fac858;">' + item.value + '%</strong>';
+        }} else {{
+            result += '<strong>$' + item.value.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}}) + '</strong>';
+        }}
+        result += '</div>';
+    }});
+    result += '</div>';
+    return result;
+}}""")
+
+
+# Value-axis labels formatted as dollar amounts
+_USD_AXIS_LABEL_JS = JsCode("function(value) { return '$' + value.toLocaleString(); }")
+
+# Data labels formatted as dollar amounts
+_USD_LABEL_JS = JsCode("function(params) { return '$' + params.value.toLocaleString(); }")
+
+# Data labels formatted as percentages
+_PERCENT_LABEL_JS = JsCode("function(params) { return params.value + '%'; }")
+
+# Heatmap cell labels, left blank for cells without cost
+_HEATMAP_LABEL_JS = JsCode(
+    "function(params) { return params.value[2] > 0 ? '$' + params.value[2].toLocaleString() : ''; }"
+)
+
+
+# Friendly display names for CUR discount line item types
+_DISCOUNT_DISPLAY_NAMES = {
+    "SavingsPlanNegation": "Savings Plans",
+    "EdpDiscount": "Enterprise Discount (EDP)",
+    "PrivateRateDiscount": "Private Rate Discount",
+    "BundledDiscount": "Bundled Discount",
+    "Credit": "Credits",
+}
+
+
+# Report page up to the charts; charts are written after it and closed by the footer
+_REPORT_HEADER_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${title}</title>
+    ${script_block}
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            padding: 40px 20px;
+            overflow-x: hidden;
+        }
+        .main-container {
+            max-width: 1600px;
+            margin: 0 auto;
+            background: #ffffff;
+            border-radius: 20px;
+            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #5470c6 0%, #91cc75 100%);
+            color: white;
+            padding: 60px 40px;
+            text-align: center;
+            overflow-wrap: break-word;
+        }
+        .header h1 {
+            font-size: 48px;
+            font-weight: 700;
+            margin-bottom: 15px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
+            word-wrap: break-word;
+        }
+        .header p {
+            font-size: 20px;
+            opacity: 0.95;
+            font-weight: 300;
+            word-wrap: break-word;
+        }
+        .content {
+            padding: 60px 40px;
+        }
+        .summary-section {
+            margin-bottom: 60px;
+        }
+        .summary-section h2 {
+            color: #2c3e50;
+            font-size: 32px;
+            font-weight: 600;
+            margin-bottom: 30px;
+            padding-bottom: 15px;
+            border-bottom: 3px solid #5470c6;
+        }
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+            gap: 25px;
+            margin-bottom: 40px;
+        }
+        .summary-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
+            overflow: hidden;
+            word-wrap: break-word;
+        }
+        .summary-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
+        }
+        .summary-card h3 {
+            font-size: 14px;
+            font-weight: 500;
+            margin-bottom: 15px;
+            opacity: 0.9;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            word-wrap: break-word;
+        }
+        .summary-card .value {
+            font-size: 36px;
+            font-weight: 700;
+            text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
+            word-wrap: break-word;
+            overflow-wrap: break-word;
+        }
+        .summary-card.small-text .value {
+            font-size: 18px;
+            font-weight: 600;
+            line-height: 1.4;
+        }
+        .charts-section {
+            margin-top: 40px;
+        }
+        .charts-section h2 {
+            color: #2c3e50;
+            font-size: 32px;
+            font-weight: 600;
+            margin-bottom: 40px;
+            padding-bottom: 15px;
+            border-bottom: 3px solid #91cc75;
+        }
+        .chart-container {
+            background: #ffffff;
+            padding: 100px 30px 30px 100px;
+            border-radius: 15px;
+            box-shadow: 0 5px 20px rgba(0, 0, 0, 0.08);
+            margin-bottom: 40px;
+            border: 1px solid #e8e8e8;
+            overflow-x: auto;
+            overflow-y: hidden;
+        }
+        .chart-container > div {
+            min-width: 600px;
+        }
+        .footer {
+            text-align: center;
+            padding: 30px;
+            background: #f8f9fa;
+            color: #6c757d;
+            font-size: 14px;
+            border-top: 1px solid #dee2e6;
+        }
+        .footer strong {
+            color: #495057;
+        }
+    </style>
+</head>
+<body>
+    <div class="main-container">
+        <div class="header">
+            <h1>${title}</h1>
+            <p>Comprehensive analysis of AWS costs and usage patterns</p>
+        </div>
+        <div class="content">
+            <div class="summary-section">
+                <h2>Executive Summary</h2>
+                <div class="summary-grid">
+                    <div class="summary-card">
+                        <h3>Total Cost</h3>
+                        <div class="value">$$${total_cost}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Number of Accounts</h3>
+                        <div class="value">${num_accounts}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Number of Services</h3>
+                        <div class="value">${num_services}</div>
+                    </div>
+                    <div class="summary-card small-text">
+                        <h3>Date Range</h3>
+                        <div class="value">${date_start}<br>to<br>${date_end}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Total Records</h3>
+                        <div class="value">${total_records}</div>
+                    </div>
+                </div>
+            </div>
+            <div class="charts-section">
+                <h2>Detailed Analysis</h2>
+""")
+
+_REPORT_FOOTER_TEMPLATE = string.Template("""
+            </div>
+        </div>
+        <div class="footer">
+            <strong>Report generated on ${generated_at}</strong><br>
+            Powered by Apache ECharts | AWS Cost and Usage Report Generator
+        </div>
+    </div>
+</body>
+</html>
+""")
+
 
 def _safe_round(value: Any, decimals: int = 2) -> float:
     """Safely round a value, handling NaN/None/Inf."""
@@ -30,9 +494,49 @@ def _safe_round(value: Any, decimals: int = 2) -> float:
         return 0.0
 
 
-def _safe_round_list(values: List[Any], decimals: int = 2) -> List[float]:
-    """Safely round a list of values."""
-    return [_safe_round(v, decimals) for v in values]
+def _safe_round_list(values: Iterable[Any], decimals: int = 2) -> List[float]:
+    """Safely round a sequence of values in one vectorized pass, mapping NaN/None/Inf to 0."""
+    arr = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float64)
+    return np.round(np.where(np.isfinite(arr), arr, 0.0), decimals).tolist()
+
+
+def _escape_text(value: Any) -> str:
+    """HTML-escape a value unless it only contains known-safe characters."""
+    text = str(value)
+    if _PLAIN_TEXT_RE.fullmatch(text):
+        return text
+    return html.escape(text)
+
+
+def _as_category(series: pd.Series) -> pd.Series:
+    """Return the series as a categorical, reusing it if it already is one."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.astype("category")
+
+
+def _pivot_by_month(
+    df: pd.DataFrame, key: str, value: str = "total_cost"
+) -> Tuple[List[str], pd.DataFrame]:
+    """
+    Aggregate a long monthly trend DataFrame into a month x key table in one grouped pass.
+
+    Args:
+        df: DataFrame with month, key and value columns
+        key: Column whose values become one series per column
+        value: Column holding the values to plot
+
+    Returns:
+        Tuple of (sorted month strings, pivot rounded to 2 decimals with columns in
+        order of first appearance and missing months filled with 0)
+    """
+    # Group on integer category codes rather than hashing the strings per row
+    df = df.assign(**{key: _as_category(df[key]), "month": _as_category(df["month"])})
+    pivot = (
+        df.groupby(["month", key], observed=True)[value].sum().unstack(key, fill_value=0.0)
+    ).sort_index()
+    pivot = pivot.reindex(columns=df[key].unique(), fill_value=0.0).round(2)
+    return pivot.index.astype(str).tolist(), pivot
 
 
 def _validate_dataframe(df: pd.DataFrame, required_columns: List[str], context: str) -> bool:
@@ -48,12 +552,12 @@ def _validate_dataframe(df: pd.DataFrame, required_columns: List[str], context:
         True if valid, False otherwise
     """
     if df is None or df.empty:
-        logger.warning(f"{context}: DataFrame is empty")
+        logger.warning("%s: DataFrame is empty", context)
         return False
 
     missing_cols = [col for col in required_columns if col not in df.columns]
     if missing_cols:
-        logger.warning(f"{context}: Missing required columns: {missing_cols}")
+        logger.warning("%s: Missing required columns: %s", context, missing_cols)
         return False
 
     return True
@@ -62,12 +566,14 @@ def _validate_dataframe(df: pd.DataFrame, required_columns: List[str], context:
 class CURVisualizer:
     """Generate interactive visualizations for AWS Cost and Usage data using Apache ECharts."""
 
-    def __init__(self, theme: str = "macarons") -> None:
+    def __init__(self, theme: str = "macarons", keep_charts: bool = True) -> None:
         """
         Initialize the visualizer.
 
         Args:
             theme: pyecharts theme to use (macarons, shine, roma, vintage, etc.)
+            keep_charts: Keep chart objects in self.charts after a report is rendered.
+                Disable for one-shot reports to release chart data as soon as it is serialized.
         """
         # Map theme names to ThemeType
         theme_map = {
@@ -79,30 +585,14 @@ class CURVisualizer:
             "light": ThemeType.LIGHT,
         }
         self.theme = theme_map.get(theme.lower(), ThemeType.MACARONS)
+        # One InitOpts per chart height, shared by every chart (charts only read them)
+        self._init_opts = {
+            height: opts.InitOpts(theme=self.theme, height=height, width="100%")
+            for height in ("600px", "650px")
+        }
+        self.keep_charts = keep_charts
         self.charts = []
 
-    @staticmethod
-    def _get_tooltip_style() -> str:
-        """
-        Get consistent tooltip styling for all charts.
-
-        Returns:
-            CSS style string for tooltips
-        """
-        return """
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border: none;
-            border-radius: 4px;
-            padding: 6px 10px;
-            box-shadow: none;
-            color: #ffffff;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            font-size: 12px;
-            line-height: 1.4;
-            max-width: 200px;
-            white-space: normal;
-        """
-
     def create_service_trend_chart(
         self, df: pd.DataFrame, title: str = "Monthly Cost by Service"
     ) -> Bar:
@@ -118,40 +608,26 @@ class CURVisualizer:
         """
         logger.info("Creating service trend chart...")
 
-        # Get unique months and services
-        months = sorted(df["month"].unique())
-        services = df["service"].unique()
+        if not _validate_dataframe(df, ["month", "service", "total_cost"], "Service trend chart"):
+            bar = Bar(init_opts=self._init_opts["650px"])
+            bar.set_global_opts(
+                title_opts=opts.TitleOpts(title=title, subtitle="No data available")
+            )
+            self.charts.append(("service_trend", bar))
+            return bar
 
-        # Month strings for x-axis
-        month_strs = [str(m) for m in months]
+        # One pivot for all services, months sorted for the x-axis
+        month_strs, pivot = _pivot_by_month(df, "service")
 
-        bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+        bar = Bar(init_opts=self._init_opts["650px"])
         bar.add_xaxis(month_strs)
 
-        # Color palette for better distinction
-        colors = [
-            "#5470c6",
-            "#91cc75",
-            "#fac858",
-            "#ee6666",
-            "#73c0de",
-            "#3ba272",
-            "#fc8452",
-            "#9a60b4",
-        ]
-
-        for i, service in enumerate(services):
-            service_data = df[df["service"] == service]
-            # Create a dict for quick lookup
-            cost_by_month = dict(zip(service_data["month"].astype(str), service_data["total_cost"]))
-            # Ensure we have values for all months
-            values = [round(cost_by_month.get(str(m), 0), 2) for m in months]
-
+        for i, service in enumerate(pivot.columns):
             bar.add_yaxis(
                 series_name=service,
-                y_axis=values,
+                y_axis=pivot[service].tolist(),
                 label_opts=opts.LabelOpts(is_show=False),
-                itemstyle_opts=opts.ItemStyleOpts(color=colors[i % len(colors)]),
+                itemstyle_opts=opts.ItemStyleOpts(color=_PALETTE[i % len(_PALETTE)]),
             )
 
         bar.set_global_opts(
@@ -167,9 +643,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Total Cost (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -179,25 +653,8 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        params.forEach(function(item) {
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
-                            result += '<strong>$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            result += '</div>';
-                        });
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_AXIS_COST_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(
                 type_="scroll",
@@ -209,20 +666,7 @@ class CURVisualizer:
                 opts.DataZoomOpts(type_="slider", range_start=0, range_end=100),
                 opts.DataZoomOpts(type_="inside"),
             ],
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_zoom=opts.ToolBoxFeatureDataZoomOpts(
-                        zoom_title="Zoom", back_title="Reset Zoom"
-                    ),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                    magic_type=opts.ToolBoxFeatureMagicTypeOpts(
-                        line_title="Line", bar_title="Bar", stack_title="Stack"
-                    ),
-                ),
-            ),
+            toolbox_opts=_TREND_TOOLBOX_OPTS,
         )
 
         self.charts.append(("service_trend", bar))
@@ -243,40 +687,28 @@ class CURVisualizer:
         """
         logger.info("Creating account trend chart...")
 
-        # Get unique months and accounts
-        months = sorted(df["month"].unique())
-        accounts = df["account_id"].unique()
+        if not _validate_dataframe(
+            df, ["month", "account_id", "total_cost"], "Account trend chart"
+        ):
+            bar = Bar(init_opts=self._init_opts["650px"])
+            bar.set_global_opts(
+                title_opts=opts.TitleOpts(title=title, subtitle="No data available")
+            )
+            self.charts.append(("account_trend", bar))
+            return bar
 
-        # Month strings for x-axis
-        month_strs = [str(m) for m in months]
+        # One pivot for all accounts, months sorted for the x-axis
+        month_strs, pivot = _pivot_by_month(df, "account_id")
 
-        bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+        bar = Bar(init_opts=self._init_opts["650px"])
         bar.add_xaxis(month_strs)
 
-        # Color palette
-        colors = [
-            "#5470c6",
-            "#91cc75",
-            "#fac858",
-            "#ee6666",
-            "#73c0de",
-            "#3ba272",
-            "#fc8452",
-            "#9a60b4",
-        ]
-
-        for i, account in enumerate(accounts):
-            account_data = df[df["account_id"] == account]
-            # Create a dict for quick lookup
-            cost_by_month = dict(zip(account_data["month"].astype(str), account_data["total_cost"]))
-            # Ensure we have values for all months
-            values = [round(cost_by_month.get(str(m), 0), 2) for m in months]
-
+        for i, account in enumerate(pivot.columns):
             bar.add_yaxis(
                 series_name=str(account),
-                y_axis=values,
+                y_axis=pivot[account].tolist(),
                 label_opts=opts.LabelOpts(is_show=False),
-                itemstyle_opts=opts.ItemStyleOpts(color=colors[i % len(colors)]),
+                itemstyle_opts=opts.ItemStyleOpts(color=_PALETTE[i % len(_PALETTE)]),
             )
 
         bar.set_global_opts(
@@ -292,9 +724,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Total Cost (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -304,25 +734,8 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        params.forEach(function(item) {
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">Account ' + item.seriesName + ':</span> ';
-                            result += '<strong>$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            result += '</div>';
-                        });
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_ACCOUNT_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(
                 type_="scroll",
@@ -334,20 +747,7 @@ class CURVisualizer:
                 opts.DataZoomOpts(type_="slider", range_start=0, range_end=100),
                 opts.DataZoomOpts(type_="inside"),
             ],
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_zoom=opts.ToolBoxFeatureDataZoomOpts(
-                        zoom_title="Zoom", back_title="Reset Zoom"
-                    ),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                    magic_type=opts.ToolBoxFeatureMagicTypeOpts(
-                        line_title="Line", bar_title="Bar", stack_title="Stack"
-                    ),
-                ),
-            ),
+            toolbox_opts=_TREND_TOOLBOX_OPTS,
         )
 
         self.charts.append(("account_trend", bar))
@@ -368,24 +768,41 @@ class CURVisualizer:
         """
         logger.info("Creating account-service heatmap...")
 
-        # Pivot the data
-        pivot_df = df.pivot(index="account_id", columns="service", values="total_cost")
-        pivot_df = pivot_df.fillna(0)
+        if not _validate_dataframe(
+            df, ["account_id", "service", "total_cost"], "Account-service heatmap"
+        ):
+            heatmap = HeatMap(init_opts=self._init_opts["600px"])
+            heatmap.set_global_opts(
+                title_opts=opts.TitleOpts(title=title, subtitle="No data available")
+            )
+            self.charts.append(("account_service_heatmap", heatmap))
+            return heatmap
+
+        # Sum per (account, service) on categorical keys and spread services into columns;
+        # duplicate pairs are aggregated and missing ones filled with 0 by the unstack
+        df = df.assign(
+            account_id=_as_category(df["account_id"]), service=_as_category(df["service"])
+        )
+        pivot_df = (
+            df.groupby(["account_id", "service"], observed=True)["total_cost"]
+            .sum()
+            .unstack("service", fill_value=0.0)
+        )
 
         # Prepare data for heatmap
         accounts = pivot_df.index.astype(str).tolist()
         services = pivot_df.columns.tolist()
-        data = []
-        max_value = 0
-        for i, account in enumerate(accounts):
-            for j, service in enumerate(services):
-                # Use values array for cleaner type handling
-                value = round(float(pivot_df.values[i, j]), 2)
-                data.append([j, i, value])
-                max_value = max(max_value, value)
+        values = np.round(pivot_df.to_numpy(dtype=np.float64), 2)
+        # One [service_idx, account_idx, value] row per non-zero cell: most accounts use only
+        # a few services, so empty pairs are left out of the payload. The grid background
+        # below is painted in the $0 colour, so they still render like zero-cost cells.
+        # The indices stay integers so they serialize as "3" rather than "3.0".
+        ys, xs = np.nonzero(values)
+        data = list(map(list, zip(xs.tolist(), ys.tolist(), values[ys, xs].tolist())))
+        max_value = max(float(values.max()), 0.0) if values.size else 0.0
 
         heatmap = (
-            HeatMap(init_opts=opts.InitOpts(theme=self.theme, height="600px", width="100%"))
+            HeatMap(init_opts=self._init_opts["600px"])
             .add_xaxis(services)
             .add_yaxis(
                 "Account",
@@ -394,9 +811,7 @@ class CURVisualizer:
                 label_opts=opts.LabelOpts(
                     is_show=True,
                     position="inside",
-                    formatter=JsCode(
-                        "function(params) { return params.value[2] > 0 ? '$' + params.value[2].toLocaleString() : ''; }"
-                    ),
+                    formatter=_HEATMAP_LABEL_JS,
                     font_size=10,
                 ),
             )
@@ -414,6 +829,12 @@ class CURVisualizer:
                 yaxis_opts=opts.AxisOpts(
                     name="Account ID",
                     type_="category",
+                    splitarea_opts=opts.SplitAreaOpts(
+                        is_show=True,
+                        areastyle_opts=opts.AreaStyleOpts(
+                            opacity=1, color=_HEATMAP_RANGE_COLORS[0]
+                        ),
+                    ),
                 ),
                 visualmap_opts=opts.VisualMapOpts(
                     min_=0,
@@ -422,7 +843,7 @@ class CURVisualizer:
                     orient="horizontal",
                     pos_left="center",
                     pos_bottom="0%",
-                    range_color=["#eef5ff", "#5470c6"],
+                    range_color=list(_HEATMAP_RANGE_COLORS),
                 ),
                 tooltip_opts=opts.TooltipOpts(
                     trigger="item",
@@ -431,29 +852,10 @@ class CURVisualizer:
                     border_color="transparent",
                     border_width=0,
                     extra_css_text="box-shadow: none;",
-                    formatter=JsCode(
-                        """function(params) {
-                            var style = `"""
-                        + self._get_tooltip_style()
-                        + """`;
-                            return '<div style="' + style + '">' +
-                                '<strong style="font-size: 12px;">Cost Breakdown</strong><br/><br/>' +
-                                '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Account: </span><strong>' + params.name + '</strong></div>' +
-                                '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Service: </span><strong>' + params.value[0] + '</strong></div>' +
-                                '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Total Cost: </span><strong>$' + params.value[2].toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong></div>' +
-                                '</div>';
-                        }"""
-                    ),
-                    textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
-                ),
-                toolbox_opts=opts.ToolboxOpts(
-                    is_show=True,
-                    feature=opts.ToolBoxFeatureOpts(
-                        save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                        restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                        data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                    ),
+                    formatter=_HEATMAP_TOOLTIP_JS,
+                    textstyle_opts=_TOOLTIP_TEXTSTYLE,
                 ),
+                toolbox_opts=_BASIC_TOOLBOX_OPTS,
             )
         )
 
@@ -475,11 +877,20 @@ class CURVisualizer:
         """
         logger.info("Creating monthly summary chart...")
 
-        months = df["month"].tolist()
-        costs = [round(x, 2) for x in df["total_cost"].tolist()]
+        if not _validate_dataframe(df, ["month", "total_cost"], "Monthly summary chart"):
+            bar = Bar(init_opts=self._init_opts["600px"])
+            bar.set_global_opts(
+                title_opts=opts.TitleOpts(title=title, subtitle="No data available")
+            )
+            self.charts.append(("monthly_summary", bar))
+            return bar
+
+        # Convert both columns once; the bar and the trend line overlay share these lists
+        months = df["month"].astype(str).to_numpy().tolist()
+        costs = df["total_cost"].round(2).to_numpy().tolist()
 
         bar = (
-            Bar(init_opts=opts.InitOpts(theme=self.theme, height="600px", width="100%"))
+            Bar(init_opts=self._init_opts["600px"])
             .add_xaxis(months)
             .add_yaxis(
                 "Monthly Cost",
@@ -487,9 +898,7 @@ class CURVisualizer:
                 label_opts=opts.LabelOpts(
                     is_show=True,
                     position="top",
-                    formatter=JsCode(
-                        "function(params) { return '$' + params.value.toLocaleString(); }"
-                    ),
+                    formatter=_USD_LABEL_JS,
                 ),
                 itemstyle_opts=opts.ItemStyleOpts(
                     color="#5470c6",
@@ -528,9 +937,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Total Cost (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -539,35 +946,11 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        params.forEach(function(item) {
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
-                            result += '<strong>$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            result += '</div>';
-                        });
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_AXIS_COST_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(pos_top="8%"),
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                ),
-            ),
+            toolbox_opts=_BASIC_TOOLBOX_OPTS,
         )
 
         self.charts.append(("monthly_summary", bar))
@@ -591,67 +974,53 @@ class CURVisualizer:
         if df.empty:
             logger.warning("No anomalies to visualize")
             # Return empty chart
-            scatter = Scatter(
-                init_opts=opts.InitOpts(theme=self.theme, height="600px", width="100%")
-            )
+            scatter = Scatter(init_opts=self._init_opts["600px"])
             return scatter
 
-        # Get unique months and services
-        months = sorted(df["month"].unique())
-        services = df["service"].unique()
-
-        # Color palette for services
-        colors = [
-            "#ee6666",  # Red for anomalies
-            "#fac858",  # Orange
-            "#91cc75",  # Green
-            "#73c0de",  # Blue
-            "#5470c6",  # Dark blue
-            "#9a60b4",  # Purple
-            "#fc8452",  # Orange-red
-            "#3ba272",  # Teal
-        ]
-
-        scatter = Scatter(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+        # Size by severity on the raw z-scores, then round every value column once up front
+        abs_z = np.abs(df["z_score"].to_numpy(dtype=np.float64))
+        df = df.assign(
+            month=df["month"].astype(str).astype("category"),
+            symbol_size=_ANOMALY_SYMBOL_SIZES[np.digitize(abs_z, _ANOMALY_SEVERITY_BINS)],
+        ).round({"total_cost": 2, "z_score": 2, "mean_cost": 2, "pct_change": 1})
+
+        # Categories of the month labels are already unique and sorted
+        months = df["month"].cat.categories.tolist()
+
+        scatter = Scatter(init_opts=self._init_opts["650px"])
         scatter.add_xaxis(months)
 
-        # Add series for each service
-        for i, service in enumerate(services):
-            service_data = df[df["service"] == service]
-
-            # Prepare data points with all information
-            data = []
-            for _, row in service_data.iterrows():
-                month_str = str(row["month"])
-                z_score = row["z_score"]
-
-                # Size based on severity
-                if abs(z_score) < 2.5:
-                    symbol_size = 12
-                elif abs(z_score) < 3:
-                    symbol_size = 16
-                else:
-                    symbol_size = 20
-
-                data.append(
-                    {
-                        "value": [
-                            month_str,
-                            round(row["total_cost"], 2),
-                            round(z_score, 2),
-                            round(row["mean_cost"], 2),
-                            round(row["pct_change"], 1),
-                        ],
-                        "symbolSize": symbol_size,
-                    }
+        # Add series for each service, split in one pass in order of first appearance
+        for i, (service, service_data) in enumerate(
+            df.groupby("service", sort=False, observed=True)
+        ):
+            # Bound the browser's render cost by keeping only the most anomalous points
+            if len(service_data) > _ANOMALY_MAX_POINTS:
+                # Select by position so duplicate index labels cannot let extra rows through
+                deviation = np.abs(service_data["z_score"].to_numpy())
+                keep = np.argsort(-deviation, kind="stable")[:_ANOMALY_MAX_POINTS]
+                service_data = service_data.iloc[np.sort(keep)]
+
+            # Prepare data points with all information; itertuples yields plain tuples
+            # of Python scalars without building a Series per row, and the tuples are
+            # used as the point values directly (serialized as JSON arrays)
+            points = service_data[["month", "total_cost", "z_score", "mean_cost", "pct_change"]]
+            data = [
+                {"value": row, "symbolSize": size}
+                for row, size in zip(
+                    points.itertuples(index=False, name=None),
+                    service_data["symbol_size"].tolist(),
                 )
+            ]
 
             scatter.add_yaxis(
                 series_name=service,
                 y_axis=data,
                 symbol="circle",
                 label_opts=opts.LabelOpts(is_show=False),
-                itemstyle_opts=opts.ItemStyleOpts(color=colors[i % len(colors)]),
+                itemstyle_opts=opts.ItemStyleOpts(
+                    color=_ANOMALY_PALETTE[i % len(_ANOMALY_PALETTE)]
+                ),
             )
 
         scatter.set_global_opts(
@@ -669,9 +1038,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Cost (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -680,24 +1047,8 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var value = params.value;
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params.seriesName + '</strong><br/><br/>';
-                        result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Month: </span><strong>' + value[0] + '</strong></div>';
-                        result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Cost: </span><strong>$' + value[1].toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong></div>';
-                        result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Average: </span><strong>$' + value[3].toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong></div>';
-                        result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Change: </span><strong style="color: ' + (value[4] > 0 ? '#ff6b6b' : '#51cf66') + ';">' + (value[4] > 0 ? '+' : '') + value[4].toFixed(1) + '%</strong></div>';
-                        result += '<div style="margin: 2px 0;"><span style="opacity: 0.9;">Z-Score: </span><strong>' + value[2].toFixed(2) + '</strong></div>';
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_ANOMALY_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(
                 type_="scroll",
@@ -709,17 +1060,7 @@ class CURVisualizer:
                 opts.DataZoomOpts(type_="slider", range_start=0, range_end=100),
                 opts.DataZoomOpts(type_="inside"),
             ],
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_zoom=opts.ToolBoxFeatureDataZoomOpts(
-                        zoom_title="Zoom", back_title="Reset Zoom"
-                    ),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                ),
-            ),
+            toolbox_opts=_ZOOM_TOOLBOX_OPTS,
         )
 
         self.charts.append(("anomalies", scatter))
@@ -741,45 +1082,25 @@ class CURVisualizer:
         logger.info("Creating region trend chart...")
 
         if not _validate_dataframe(df, ["month", "region", "total_cost"], "Region trend chart"):
-            bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+            bar = Bar(init_opts=self._init_opts["650px"])
             bar.set_global_opts(
                 title_opts=opts.TitleOpts(title=title, subtitle="No data available")
             )
             self.charts.append(("region_trend", bar))
             return bar
 
-        # Get unique months and regions
-        months = sorted(df["month"].unique())
-        regions = df["region"].unique()
-
-        # Month strings for x-axis
-        month_strs = [str(m) for m in months]
+        # One pivot for all regions, months sorted for the x-axis
+        month_strs, pivot = _pivot_by_month(df, "region")
 
-        bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+        bar = Bar(init_opts=self._init_opts["650px"])
         bar.add_xaxis(month_strs)
 
-        # Color palette
-        colors = [
-            "#5470c6",
-            "#91cc75",
-            "#fac858",
-            "#ee6666",
-            "#73c0de",
-            "#3ba272",
-            "#fc8452",
-            "#9a60b4",
-        ]
-
-        for i, region in enumerate(regions):
-            region_data = df[df["region"] == region]
-            cost_by_month = dict(zip(region_data["month"].astype(str), region_data["total_cost"]))
-            values = [round(cost_by_month.get(str(m), 0), 2) for m in months]
-
+        for i, region in enumerate(pivot.columns):
             bar.add_yaxis(
                 series_name=str(region),
-                y_axis=values,
+                y_axis=pivot[region].tolist(),
                 label_opts=opts.LabelOpts(is_show=False),
-                itemstyle_opts=opts.ItemStyleOpts(color=colors[i % len(colors)]),
+                itemstyle_opts=opts.ItemStyleOpts(color=_PALETTE[i % len(_PALETTE)]),
             )
 
         bar.set_global_opts(
@@ -795,9 +1116,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Total Cost (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -807,25 +1126,8 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        params.forEach(function(item) {
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
-                            result += '<strong>$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            result += '</div>';
-                        });
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_AXIS_COST_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(
                 type_="scroll",
@@ -837,20 +1139,7 @@ class CURVisualizer:
                 opts.DataZoomOpts(type_="slider", range_start=0, range_end=100),
                 opts.DataZoomOpts(type_="inside"),
             ],
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_zoom=opts.ToolBoxFeatureDataZoomOpts(
-                        zoom_title="Zoom", back_title="Reset Zoom"
-                    ),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                    magic_type=opts.ToolBoxFeatureMagicTypeOpts(
-                        line_title="Line", bar_title="Bar", stack_title="Stack"
-                    ),
-                ),
-            ),
+            toolbox_opts=_TREND_TOOLBOX_OPTS,
         )
 
         self.charts.append(("region_trend", bar))
@@ -874,48 +1163,33 @@ class CURVisualizer:
         if not _validate_dataframe(
             df, ["month", "discount_type", "total_discount"], "Discounts trend chart"
         ):
-            bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+            bar = Bar(init_opts=self._init_opts["650px"])
             bar.set_global_opts(
                 title_opts=opts.TitleOpts(title=title, subtitle="No discount data available")
             )
             self.charts.append(("discounts_trend", bar))
             return bar
 
-        # Map to friendly names
-        friendly_names = {
-            "SavingsPlanNegation": "Savings Plans",
-            "EdpDiscount": "Enterprise Discount (EDP)",
-            "PrivateRateDiscount": "Private Rate Discount",
-            "BundledDiscount": "Bundled Discount",
-            "Credit": "Credits",
-        }
-        df = df.copy()
-        df["display_name"] = df["discount_type"].map(
-            lambda x: friendly_names.get(x, x) if pd.notna(x) else "Unknown"
+        # Map to friendly names without copying the input frame
+        raw_types = df["discount_type"].astype(object)
+        df = df.assign(
+            display_name=raw_types.map(_DISCOUNT_DISPLAY_NAMES).fillna(raw_types).fillna("Unknown")
         )
 
-        months = sorted(df["month"].unique())
-        discount_types = df["display_name"].unique()
-        month_strs = [str(m) for m in months]
+        month_strs, pivot = _pivot_by_month(df, "display_name", "total_discount")
 
-        bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+        bar = Bar(init_opts=self._init_opts["650px"])
         bar.add_xaxis(month_strs)
 
-        colors = ["#91cc75", "#5470c6", "#ee6666", "#fac858", "#73c0de"]
-
-        for i, dtype in enumerate(discount_types):
-            type_data = df[df["display_name"] == dtype]
-            discount_by_month = dict(
-                zip(type_data["month"].astype(str), type_data["total_discount"])
-            )
-            values = [round(discount_by_month.get(str(m), 0), 2) for m in months]
-
+        for i, dtype in enumerate(pivot.columns):
             bar.add_yaxis(
                 series_name=str(dtype),
-                y_axis=values,
+                y_axis=pivot[dtype].tolist(),
                 stack="discounts",
                 label_opts=opts.LabelOpts(is_show=False),
-                itemstyle_opts=opts.ItemStyleOpts(color=colors[i % len(colors)]),
+                itemstyle_opts=opts.ItemStyleOpts(
+                    color=_DISCOUNT_TYPE_PALETTE[i % len(_DISCOUNT_TYPE_PALETTE)]
+                ),
             )
 
         bar.set_global_opts(
@@ -932,9 +1206,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Discount Amount (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -944,29 +1216,8 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        var total = 0;
-                        params.forEach(function(item) {
-                            total += item.value;
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
-                            result += '<strong style="color: #91cc75;">$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            result += '</div>';
-                        });
-                        result += '<hr style="margin: 4px 0; border-color: rgba(255,255,255,0.2);"/>';
-                        result += '<div><strong>Total: $' + total.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong></div>';
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_DISCOUNT_TOTAL_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(
                 type_="scroll",
@@ -978,14 +1229,7 @@ class CURVisualizer:
                 opts.DataZoomOpts(type_="slider", range_start=0, range_end=100),
                 opts.DataZoomOpts(type_="inside"),
             ],
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                ),
-            ),
+            toolbox_opts=_BASIC_TOOLBOX_OPTS,
         )
 
         self.charts.append(("discounts_trend", bar))
@@ -1009,43 +1253,26 @@ class CURVisualizer:
         if not _validate_dataframe(
             df, ["month", "service", "total_discount"], "Discounts by service trend chart"
         ):
-            bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+            bar = Bar(init_opts=self._init_opts["650px"])
             bar.set_global_opts(
                 title_opts=opts.TitleOpts(title=title, subtitle="No discount data available")
             )
             self.charts.append(("discounts_by_service_trend", bar))
             return bar
 
-        months = sorted(df["month"].unique())
-        services = df["service"].unique()
-        month_strs = [str(m) for m in months]
+        month_strs, pivot = _pivot_by_month(df, "service", "total_discount")
 
-        bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="650px", width="100%"))
+        bar = Bar(init_opts=self._init_opts["650px"])
         bar.add_xaxis(month_strs)
 
-        colors = [
-            "#91cc75",
-            "#5470c6",
-            "#fac858",
-            "#ee6666",
-            "#73c0de",
-            "#3ba272",
-            "#fc8452",
-            "#9a60b4",
-        ]
-
-        for i, service in enumerate(services):
-            service_data = df[df["service"] == service]
-            discount_by_month = dict(
-                zip(service_data["month"].astype(str), service_data["total_discount"])
-            )
-            values = [round(discount_by_month.get(str(m), 0), 2) for m in months]
-
+        for i, service in enumerate(pivot.columns):
             bar.add_yaxis(
                 series_name=str(service),
-                y_axis=values,
+                y_axis=pivot[service].tolist(),
                 label_opts=opts.LabelOpts(is_show=False),
-                itemstyle_opts=opts.ItemStyleOpts(color=colors[i % len(colors)]),
+                itemstyle_opts=opts.ItemStyleOpts(
+                    color=_DISCOUNT_PALETTE[i % len(_DISCOUNT_PALETTE)]
+                ),
             )
 
         bar.set_global_opts(
@@ -1061,9 +1288,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Discount Amount (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -1073,25 +1298,8 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        params.forEach(function(item) {
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
-                            result += '<strong style="color: #91cc75;">$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            result += '</div>';
-                        });
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_DISCOUNT_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(
                 type_="scroll",
@@ -1103,14 +1311,7 @@ class CURVisualizer:
                 opts.DataZoomOpts(type_="slider", range_start=0, range_end=100),
                 opts.DataZoomOpts(type_="inside"),
             ],
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                ),
-            ),
+            toolbox_opts=_BASIC_TOOLBOX_OPTS,
         )
 
         self.charts.append(("discounts_by_service_trend", bar))
@@ -1134,7 +1335,7 @@ class CURVisualizer:
         if not _validate_dataframe(
             df, ["month", "on_demand_equivalent", "savings"], "Savings Plan trend chart"
         ):
-            bar = Bar(init_opts=opts.InitOpts(theme=self.theme, height="600px", width="100%"))
+            bar = Bar(init_opts=self._init_opts["600px"])
             bar.set_global_opts(
                 title_opts=opts.TitleOpts(title=title, subtitle="No Savings Plan data available")
             )
@@ -1142,12 +1343,12 @@ class CURVisualizer:
             return bar
 
         months = df["month"].tolist()
-        on_demand = _safe_round_list(df["on_demand_equivalent"].tolist())
-        savings = _safe_round_list(df["savings"].tolist())
-        savings_pct = _safe_round_list(df["savings_percentage"].tolist(), 1)
+        on_demand = _safe_round_list(df["on_demand_equivalent"])
+        savings = _safe_round_list(df["savings"])
+        savings_pct = _safe_round_list(df["savings_percentage"], 1)
 
         bar = (
-            Bar(init_opts=opts.InitOpts(theme=self.theme, height="600px", width="100%"))
+            Bar(init_opts=self._init_opts["600px"])
             .add_xaxis(months)
             .add_yaxis(
                 "On-Demand Equivalent",
@@ -1161,9 +1362,7 @@ class CURVisualizer:
                 label_opts=opts.LabelOpts(
                     is_show=True,
                     position="top",
-                    formatter=JsCode(
-                        "function(params) { return '$' + params.value.toLocaleString(); }"
-                    ),
+                    formatter=_USD_LABEL_JS,
                 ),
                 itemstyle_opts=opts.ItemStyleOpts(color="#91cc75"),
             )
@@ -1192,7 +1391,7 @@ class CURVisualizer:
                 itemstyle_opts=opts.ItemStyleOpts(color="#fac858"),
                 label_opts=opts.LabelOpts(
                     is_show=True,
-                    formatter=JsCode("function(params) { return params.value + '%'; }"),
+                    formatter=_PERCENT_LABEL_JS,
                 ),
             )
         )
@@ -1211,9 +1410,7 @@ class CURVisualizer:
             ),
             yaxis_opts=opts.AxisOpts(
                 name="Cost (USD)",
-                axislabel_opts=opts.LabelOpts(
-                    formatter=JsCode("function(value) { return '$' + value.toLocaleString(); }")
-                ),
+                axislabel_opts=opts.LabelOpts(formatter=_USD_AXIS_LABEL_JS),
             ),
             tooltip_opts=opts.TooltipOpts(
                 trigger="axis",
@@ -1222,311 +1419,169 @@ class CURVisualizer:
                 border_color="transparent",
                 border_width=0,
                 extra_css_text="box-shadow: none;",
-                formatter=JsCode(
-                    """function(params) {
-                        var style = `"""
-                    + self._get_tooltip_style()
-                    + """`;
-                        var result = '<div style="' + style + '">';
-                        result += '<strong style="font-size: 12px;">' + params[0].name + '</strong><br/><br/>';
-                        params.forEach(function(item) {
-                            result += '<div style="margin: 2px 0;">';
-                            result += item.marker + ' ';
-                            result += '<span style="opacity: 0.9;">' + item.seriesName + ':</span> ';
-                            if (item.seriesName === 'Savings %') {
-                                result += '<strong style="color: #fac858;">' + item.value + '%</strong>';
-                            } else {
-                                result += '<strong>$' + item.value.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2}) + '</strong>';
-                            }
-                            result += '</div>';
-                        });
-                        result += '</div>';
-                        return result;
-                    }"""
-                ),
-                textstyle_opts=opts.TextStyleOpts(color="#ffffff"),
+                formatter=_SAVINGS_PLAN_TOOLTIP_JS,
+                textstyle_opts=_TOOLTIP_TEXTSTYLE,
             ),
             legend_opts=opts.LegendOpts(pos_top="12%"),
-            toolbox_opts=opts.ToolboxOpts(
-                is_show=True,
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image=opts.ToolBoxFeatureSaveAsImageOpts(title="Save as Image"),
-                    restore=opts.ToolBoxFeatureRestoreOpts(title="Restore"),
-                    data_view=opts.ToolBoxFeatureDataViewOpts(title="Data View"),
-                ),
-            ),
+            toolbox_opts=_BASIC_TOOLBOX_OPTS,
         )
 
         self.charts.append(("savings_plan_trend", bar))
         return bar
 
-    def generate_html_report(
-        self, output_path: str, summary_stats: dict, title: str = "AWS Cost and Usage Report"
-    ) -> str:
+    def _render_chart_html(self) -> Tuple[str, str]:
         """
-        Generate a comprehensive HTML report with all visualizations.
-
-        Args:
-            output_path: Path to save the HTML report
-            summary_stats: Dictionary with summary statistics
-            title: Report title
+        Render all charts once into head scripts and body content.
 
         Returns:
-            Path to the generated HTML file
+            Tuple of (script_block, chart_content) HTML strings
         """
-        logger.info(f"Generating HTML report: {output_path}")
-
         # Create Page object to combine all charts
         page = Page(layout=Page.SimplePageLayout)
 
         # Add all charts to the page
         for name, chart in self.charts:
+            chart.locale = _CHART_LOCALE
             page.add(chart)
 
-        # Save the page
-        page.render(output_path)
-
-        # Read the generated HTML and inject our custom header
-        with open(output_path, "r", encoding="utf-8") as f:
-            chart_html = f.read()
-
-        # Extract script dependencies from head (ECharts libraries)
-        scripts = []
-        head_match = re.search(r"<head>(.*?)</head>", chart_html, re.DOTALL)
-        if head_match:
-            head_content = head_match.group(1)
-            # Find all script tags (both src and inline)
-            scripts = re.findall(r"<script[^>]*>.*?</script>", head_content, re.DOTALL)
-
-        script_block = "\n".join(scripts)
-
-        # Extract the chart content (everything after <body>)
-        # Use regex to find body tag with potential attributes
-        body_match = re.search(r"<body[^>]*>", chart_html)
-        if body_match:
-            chart_content = chart_html[body_match.end() :]  # Skip <body> tag
-
-            # Remove closing tags to append footer properly
-            chart_content = chart_content.replace("</body>", "").replace("</html>", "")
-
-            # Replace Chinese locale with English
-            chart_content = chart_content.replace("locale: 'ZH'", "locale: 'EN'")
-            chart_content = chart_content.replace('locale: "ZH"', 'locale: "EN"')
-        else:
-            # Fallback if no body tag found (unlikely with pyecharts)
-            chart_content = chart_html
-            # Replace Chinese locale with English
-            chart_content = chart_content.replace("locale: 'ZH'", "locale: 'EN'")
-            chart_content = chart_content.replace('locale: "ZH"', 'locale: "EN"')
+        # Render only the chart bodies; the report template provides the surrounding page
+        chart_content = page.render_embed(
+            template_name=_CHART_TEMPLATE_NAME, env=_CHART_TEMPLATE_ENV
+        )
+
+        # render_embed resolved the ECharts library links for the report head
+        script_block = "\n".join(
+            f'<script type="text/javascript" src="{html.escape(dep)}"></script>'
+            for dep in page.dependencies
+        )
 
+        return script_block, chart_content
+
+    def _release_charts(self) -> None:
+        """Drop the charts of a one-shot visualizer once its report has been written."""
+        if not self.keep_charts:
+            self.charts = []
+
+    def _render_to(
+        self,
+        write: Callable[[str], Any],
+        summary_stats: dict,
+        title: str,
+        script_block: str,
+        chart_content: str,
+    ) -> None:
+        """
+        Write the full HTML report, piece by piece, through the given write callable.
+
+        Args:
+            write: Callable receiving successive chunks of the HTML document
+            summary_stats: Dictionary with summary statistics
+            title: Report title
+            script_block: Script tags extracted from the rendered chart page
+            chart_content: Rendered chart body content
+        """
         # Escape user-provided content to prevent XSS
         safe_title = html.escape(str(title))
         safe_total_cost = _safe_round(summary_stats.get("total_cost", 0), 2)
         safe_num_accounts = int(summary_stats.get("num_accounts", 0))
         safe_num_services = int(summary_stats.get("num_services", 0))
-        safe_date_start = html.escape(str(summary_stats.get("date_range_start", "N/A")))
-        safe_date_end = html.escape(str(summary_stats.get("date_range_end", "N/A")))
+        safe_date_start = _escape_text(summary_stats.get("date_range_start", "N/A"))
+        safe_date_end = _escape_text(summary_stats.get("date_range_end", "N/A"))
         safe_total_records = int(summary_stats.get("total_records", 0))
 
         # Create summary HTML
-        summary_html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{safe_title}</title>
-            {script_block}
-            <style>
-                * {{
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }}
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    padding: 40px 20px;
-                    overflow-x: hidden;
-                }}
-                .main-container {{
-                    max-width: 1600px;
-                    margin: 0 auto;
-                    background: #ffffff;
-                    border-radius: 20px;
-                    box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-                    overflow: hidden;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #5470c6 0%, #91cc75 100%);
-                    color: white;
-                    padding: 60px 40px;
-                    text-align: center;
-                    overflow-wrap: break-word;
-                }}
-                .header h1 {{
-                    font-size: 48px;
-                    font-weight: 700;
-                    margin-bottom: 15px;
-                    text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-                    word-wrap: break-word;
-                }}
-                .header p {{
-                    font-size: 20px;
-                    opacity: 0.95;
-                    font-weight: 300;
-                    word-wrap: break-word;
-                }}
-                .content {{
-                    padding: 60px 40px;
-                }}
-                .summary-section {{
-                    margin-bottom: 60px;
-                }}
-                .summary-section h2 {{
-                    color: #2c3e50;
-                    font-size: 32px;
-                    font-weight: 600;
-                    margin-bottom: 30px;
-                    padding-bottom: 15px;
-                    border-bottom: 3px solid #5470c6;
-                }}
-                .summary-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-                    gap: 25px;
-                    margin-bottom: 40px;
-                }}
-                .summary-card {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 15px;
-                    box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
-                    transition: transform 0.3s ease, box-shadow 0.3s ease;
-                    overflow: hidden;
-                    word-wrap: break-word;
-                }}
-                .summary-card:hover {{
-                    transform: translateY(-5px);
-                    box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
-                }}
-                .summary-card h3 {{
-                    font-size: 14px;
-                    font-weight: 500;
-                    margin-bottom: 15px;
-                    opacity: 0.9;
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                    word-wrap: break-word;
-                }}
-                .summary-card .value {{
-                    font-size: 36px;
-                    font-weight: 700;
-                    text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-                    word-wrap: break-word;
-                    overflow-wrap: break-word;
-                }}
-                .summary-card.small-text .value {{
-                    font-size: 18px;
-                    font-weight: 600;
-                    line-height: 1.4;
-                }}
-                .charts-section {{
-                    margin-top: 40px;
-                }}
-                .charts-section h2 {{
-                    color: #2c3e50;
-                    font-size: 32px;
-                    font-weight: 600;
-                    margin-bottom: 40px;
-                    padding-bottom: 15px;
-                    border-bottom: 3px solid #91cc75;
-                }}
-                .chart-container {{
-                    background: #ffffff;
-                    padding: 100px 30px 30px 100px;
-                    border-radius: 15px;
-                    box-shadow: 0 5px 20px rgba(0, 0, 0, 0.08);
-                    margin-bottom: 40px;
-                    border: 1px solid #e8e8e8;
-                    overflow-x: auto;
-                    overflow-y: hidden;
-                }}
-                .chart-container > div {{
-                    min-width: 600px;
-                }}
-                .footer {{
-                    text-align: center;
-                    padding: 30px;
-                    background: #f8f9fa;
-                    color: #6c757d;
-                    font-size: 14px;
-                    border-top: 1px solid #dee2e6;
-                }}
-                .footer strong {{
-                    color: #495057;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="main-container">
-                <div class="header">
-                    <h1>{safe_title}</h1>
-                    <p>Comprehensive analysis of AWS costs and usage patterns</p>
-                </div>
-                <div class="content">
-                    <div class="summary-section">
-                        <h2>Executive Summary</h2>
-                        <div class="summary-grid">
-                            <div class="summary-card">
-                                <h3>Total Cost</h3>
-                                <div class="value">${safe_total_cost:,.2f}</div>
-                            </div>
-                            <div class="summary-card">
-                                <h3>Number of Accounts</h3>
-                                <div class="value">{safe_num_accounts}</div>
-                            </div>
-                            <div class="summary-card">
-                                <h3>Number of Services</h3>
-                                <div class="value">{safe_num_services}</div>
-                            </div>
-                            <div class="summary-card small-text">
-                                <h3>Date Range</h3>
-                                <div class="value">{safe_date_start}<br>to<br>{safe_date_end}</div>
-                            </div>
-                            <div class="summary-card">
-                                <h3>Total Records</h3>
-                                <div class="value">{safe_total_records:,}</div>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="charts-section">
-                        <h2>Detailed Analysis</h2>
-        """
+        summary_html = _REPORT_HEADER_TEMPLATE.substitute(
+            title=safe_title,
+            script_block=script_block,
+            total_cost=f"{safe_total_cost:,.2f}",
+            num_accounts=safe_num_accounts,
+            num_services=safe_num_services,
+            date_start=safe_date_start,
+            date_end=safe_date_end,
+            total_records=f"{safe_total_records:,}",
+        )
 
         # Combine our custom HTML with the charts
-        footer_html = f"""
-                    </div>
-                </div>
-                <div class="footer">
-                    <strong>Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</strong><br>
-                    Powered by Apache ECharts | AWS Cost and Usage Report Generator
-                </div>
-            </div>
-        </body>
-        </html>
+        footer_html = _REPORT_FOOTER_TEMPLATE.substitute(
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+
+        write(summary_html)
+        write(chart_content)
+        write(footer_html)
+
+    def generate_html_report(
+        self, output_path: str, summary_stats: dict, title: str = "AWS Cost and Usage Report"
+    ) -> str:
+        """
+        Generate a comprehensive HTML report with all visualizations.
+
+        Args:
+            output_path: Path to save the HTML report
+            summary_stats: Dictionary with summary statistics
+            title: Report title
+
+        Returns:
+            Path to the generated HTML file
         """
+        logger.info("Generating HTML report: %s", output_path)
 
-        final_html = summary_html + chart_content + footer_html
+        script_block, chart_content = self._render_chart_html()
 
         # Write the final HTML
         os.makedirs(
             os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True
         )
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_html)
+        with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            self._render_to(f.write, summary_stats, title, script_block, chart_content)
+        self._release_charts()
 
-        logger.info(f"HTML report generated successfully: {output_path}")
+        logger.info("HTML report generated successfully: %s", output_path)
         return output_path
+
+    def write_reports(self, reports: Iterable[Tuple[str, dict, str]], output_dir: str) -> List[str]:
+        """
+        Write several HTML reports that share the current charts in a single batch.
+
+        Charts are rendered once for the whole batch and each file is written through a
+        1 MiB buffered writer. The output directory is fsynced once at the end so the new
+        report entries are durable; like generate_html_report, file contents are left for
+        the OS to flush.
+
+        Args:
+            reports: Iterable of (filename, summary_stats, title) tuples
+            output_dir: Directory to write the reports into
+
+        Returns:
+            List of paths to the generated HTML files
+
+        Raises:
+            ValueError: If a filename is not a plain file name inside output_dir
+        """
+        reports = list(reports)
+        for filename, _, _ in reports:
+            if os.path.basename(filename) != filename or filename in ("", ".", ".."):
+                raise ValueError(f"Report filename must be a plain file name, got {filename!r}")
+
+        os.makedirs(output_dir, exist_ok=True)
+        script_block, chart_content = self._render_chart_html()
+
+        output_paths = []
+        for filename, summary_stats, title in reports:
+            output_path = os.path.join(output_dir, filename)
+            logger.info("Generating HTML report: %s", output_path)
+            with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                self._render_to(f.write, summary_stats, title, script_block, chart_content)
+            output_paths.append(output_path)
+
+        # Directories cannot be opened for fsync on Windows
+        if output_paths and hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(output_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        self._release_charts()
+
+        logger.info("Generated %d HTML reports in %s", len(output_paths), output_dir)
+        return output_paths
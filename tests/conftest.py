@@ -4,355 +4,314 @@ import gzip
 import io
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cur_data():
-    """Generate 6 months of realistic CUR data with multiple accounts and comprehensive service coverage."""
-    import random
+    """
+    Generate 6 months of realistic CUR data with multiple accounts and comprehensive service coverage.
 
-    random.seed(42)  # For reproducibility
+    Built once per test session and shared between tests, so tests must not modify it.
+    """
+    rng = np.random.default_rng(42)  # For reproducibility
 
     # 6 months of monthly data (Jan - Jun 2024)
     dates = pd.date_range(start="2024-01-01", end="2024-06-01", freq="MS")
-    regions = [
-        "us-east-1",
-        "us-west-2",
-        "eu-west-1",
-        "eu-central-1",
-        "ap-southeast-1",
-        "ap-northeast-1",
-        "ca-central-1",
-    ]
-
-    data = []
-
-    for i, date in enumerate(dates):
-        month_num = i  # 0-5 for Jan-Jun
-
-        # ========================================
-        # PRODUCTION ACCOUNT (111111111111)
-        # Enterprise workload with high, steady costs
-        # ========================================
-        prod_growth = 1 + (month_num * 0.15)  # 15% growth per month
-
-        services_prod = {
-            "AmazonEC2": {
-                "base": 350000 * prod_growth,
-                "pattern": lambda: random.uniform(0.97, 1.03),
-            },
-            "AmazonRDS": {
-                "base": 255000 * prod_growth,
-                "pattern": lambda: random.uniform(0.98, 1.02),  # Very stable
-            },
-            "AmazonS3": {
-                "base": 125000 + (month_num * 8000),  # Continuous growth
-                "pattern": lambda: random.uniform(0.99, 1.01),
-            },
-            "AmazonEKS": {
-                "base": 204000 * prod_growth,
-                "pattern": lambda: random.uniform(0.96, 1.04),
-            },
-            "AWSLambda": {
-                "base": 84000,
-                "pattern": lambda: random.uniform(0.90, 1.10),
-            },
-            "AmazonCloudFront": {
-                "base": 165000,
-                "pattern": lambda: random.uniform(0.92, 1.08),
-            },
-            "AmazonDynamoDB": {
-                "base": 96000 * prod_growth,
-                "pattern": lambda: random.uniform(0.95, 1.05),
-            },
-            "AmazonElastiCache": {
-                "base": 72000 * prod_growth,
-                "pattern": lambda: random.uniform(0.97, 1.03),
-            },
-            "AmazonRedshift": {
-                "base": 216000 * prod_growth,
-                "pattern": lambda: random.uniform(0.98, 1.02),
-            },
-            "AmazonRoute53": {
-                "base": 25500,
-                "pattern": lambda: random.uniform(0.95, 1.05),
-            },
-            "AmazonCloudWatch": {
-                "base": 54000,
-                "pattern": lambda: random.uniform(0.92, 1.08),
-            },
-            "AmazonECS": {
-                "base": 135000 * prod_growth,
-                "pattern": lambda: random.uniform(0.94, 1.06),
-            },
-        }
+    month_num = np.arange(len(dates))  # 0-5 for Jan-Jun
+    regions = np.array(
+        [
+            "us-east-1",
+            "us-west-2",
+            "eu-west-1",
+            "eu-central-1",
+            "ap-southeast-1",
+            "ap-northeast-1",
+            "ca-central-1",
+        ]
+    )
+
+    # Each service maps to (monthly base cost, low, high), where the monthly cost is the
+    # base scaled by a uniform random multiplier in [low, high). Any of the three may be
+    # a per-month array.
+
+    # ========================================
+    # PRODUCTION ACCOUNT (111111111111)
+    # Enterprise workload with high, steady costs
+    # ========================================
+    prod_growth = 1 + (month_num * 0.15)  # 15% growth per month
+
+    services_prod = {
+        "AmazonEC2": (350000 * prod_growth, 0.97, 1.03),
+        "AmazonRDS": (255000 * prod_growth, 0.98, 1.02),  # Very stable
+        "AmazonS3": (125000 + (month_num * 8000), 0.99, 1.01),  # Continuous growth
+        "AmazonEKS": (204000 * prod_growth, 0.96, 1.04),
+        "AWSLambda": (84000, 0.90, 1.10),
+        "AmazonCloudFront": (165000, 0.92, 1.08),
+        "AmazonDynamoDB": (96000 * prod_growth, 0.95, 1.05),
+        "AmazonElastiCache": (72000 * prod_growth, 0.97, 1.03),
+        "AmazonRedshift": (216000 * prod_growth, 0.98, 1.02),
+        "AmazonRoute53": (25500, 0.95, 1.05),
+        "AmazonCloudWatch": (54000, 0.92, 1.08),
+        "AmazonECS": (135000 * prod_growth, 0.94, 1.06),
+    }
 
-        # ========================================
-        # STAGING ACCOUNT (222222222222)
-        # Medium-sized with moderate growth
-        # ========================================
-        staging_growth = 1 + (month_num * 0.08)
-
-        services_staging = {
-            "AmazonEC2": {
-                "base": 135000 * staging_growth,
-                "pattern": lambda: random.uniform(0.85, 1.15),
-            },
-            "AmazonRDS": {
-                "base": 96000 * staging_growth,
-                "pattern": lambda: random.uniform(0.90, 1.10),
-            },
-            "AmazonS3": {
-                "base": 54000 + (month_num * 3000),
-                "pattern": lambda: random.uniform(0.95, 1.05),
-            },
-            "AmazonEKS": {
-                "base": 84000 * staging_growth,
-                "pattern": lambda: random.uniform(0.88, 1.12),
-            },
-            "AWSLambda": {
-                "base": 27000,
-                "pattern": lambda: random.uniform(0.80, 1.20),
-            },
-            "AmazonCloudFront": {
-                "base": 36000,
-                "pattern": lambda: random.uniform(0.85, 1.15),
-            },
-            "AmazonDynamoDB": {
-                "base": 42000 * staging_growth,
-                "pattern": lambda: random.uniform(0.92, 1.08),
-            },
-            "AmazonElastiCache": {
-                "base": 24000 * staging_growth,
-                "pattern": lambda: random.uniform(0.95, 1.05),
-            },
-        }
+    # ========================================
+    # STAGING ACCOUNT (222222222222)
+    # Medium-sized with moderate growth
+    # ========================================
+    staging_growth = 1 + (month_num * 0.08)
+
+    services_staging = {
+        "AmazonEC2": (135000 * staging_growth, 0.85, 1.15),
+        "AmazonRDS": (96000 * staging_growth, 0.90, 1.10),
+        "AmazonS3": (54000 + (month_num * 3000), 0.95, 1.05),
+        "AmazonEKS": (84000 * staging_growth, 0.88, 1.12),
+        "AWSLambda": (27000, 0.80, 1.20),
+        "AmazonCloudFront": (36000, 0.85, 1.15),
+        "AmazonDynamoDB": (42000 * staging_growth, 0.92, 1.08),
+        "AmazonElastiCache": (24000 * staging_growth, 0.95, 1.05),
+    }
 
-        # ========================================
-        # DEVELOPMENT ACCOUNT (333333333333)
-        # Small, variable usage with occasional load testing
-        # ========================================
-        is_load_test_month = month_num % 2 == 0  # Load tests in Jan, Mar, May
-
-        services_dev = {
-            "AmazonEC2": {
-                "base": 45000,
-                "pattern": lambda: (
-                    random.uniform(1.5, 2.5) if is_load_test_month else random.uniform(0.6, 1.2)
-                ),
-            },
-            "AmazonRDS": {
-                "base": 54000,
-                "pattern": lambda: random.uniform(0.7, 1.3),
-            },
-            "AmazonS3": {
-                "base": 18000 + (month_num * 1500),
-                "pattern": lambda: random.uniform(0.90, 1.10),
-            },
-            "AmazonEKS": {
-                "base": 36000,
-                "pattern": lambda: (
-                    random.uniform(1.8, 2.8) if is_load_test_month else random.uniform(0.5, 1.0)
-                ),
-            },
-            "AWSLambda": {
-                "base": 9000,
-                "pattern": lambda: (
-                    random.uniform(2.0, 4.0) if is_load_test_month else random.uniform(0.5, 1.5)
-                ),
-            },
-            "AmazonCloudFront": {
-                "base": 15000,
-                "pattern": lambda: random.uniform(0.6, 1.4),
-            },
-            "AmazonDynamoDB": {
-                "base": max(27000 - (month_num * 3000), 5000),  # Migrating away
-                "pattern": lambda: random.uniform(0.8, 1.2),
-            },
-        }
+    # ========================================
+    # DEVELOPMENT ACCOUNT (333333333333)
+    # Small, variable usage with occasional load testing
+    # ========================================
+    is_load_test_month = month_num % 2 == 0  # Load tests in Jan, Mar, May
+
+    services_dev = {
+        "AmazonEC2": (
+            45000,
+            np.where(is_load_test_month, 1.5, 0.6),
+            np.where(is_load_test_month, 2.5, 1.2),
+        ),
+        "AmazonRDS": (54000, 0.7, 1.3),
+        "AmazonS3": (18000 + (month_num * 1500), 0.90, 1.10),
+        "AmazonEKS": (
+            36000,
+            np.where(is_load_test_month, 1.8, 0.5),
+            np.where(is_load_test_month, 2.8, 1.0),
+        ),
+        "AWSLambda": (
+            9000,
+            np.where(is_load_test_month, 2.0, 0.5),
+            np.where(is_load_test_month, 4.0, 1.5),
+        ),
+        "AmazonCloudFront": (15000, 0.6, 1.4),
+        "AmazonDynamoDB": (
+            np.maximum(27000 - (month_num * 3000), 5000),
+            0.8,
+            1.2,
+        ),  # Migrating away
+    }
 
-        # ========================================
-        # SANDBOX ACCOUNT (444444444444)
-        # Very small, experimental workloads
-        # ========================================
-        services_sandbox = {
-            "AmazonEC2": {
-                "base": 12000,
-                "pattern": lambda: random.uniform(0.3, 2.0),  # Highly variable
-            },
-            "AmazonRDS": {
-                "base": 10500,
-                "pattern": lambda: random.uniform(0.5, 1.5),
-            },
-            "AmazonS3": {
-                "base": 5400 + (month_num * 300),
-                "pattern": lambda: random.uniform(0.9, 1.1),
-            },
-            "AWSLambda": {
-                "base": 3600,
-                "pattern": lambda: random.uniform(0.2, 2.5),
-            },
-            "AmazonDynamoDB": {
-                "base": 6000,
-                "pattern": lambda: random.uniform(0.5, 2.0),
-            },
-        }
+    # ========================================
+    # SANDBOX ACCOUNT (444444444444)
+    # Very small, experimental workloads
+    # ========================================
+    services_sandbox = {
+        "AmazonEC2": (12000, 0.3, 2.0),  # Highly variable
+        "AmazonRDS": (10500, 0.5, 1.5),
+        "AmazonS3": (5400 + (month_num * 300), 0.9, 1.1),
+        "AWSLambda": (3600, 0.2, 2.5),
+        "AmazonDynamoDB": (6000, 0.5, 2.0),
+    }
 
-        # ========================================
-        # SECURITY ACCOUNT (555555555555)
-        # Security & compliance tooling, steady usage
-        # ========================================
-        services_security = {
-            "AmazonEC2": {
-                "base": 84000,
-                "pattern": lambda: random.uniform(0.98, 1.02),  # Very steady
-            },
-            "AmazonS3": {
-                "base": 105000 + (month_num * 5000),  # Log storage, continuous growth
-                "pattern": lambda: random.uniform(0.99, 1.01),
-            },
-            "AmazonCloudWatch": {
-                "base": 66000,
-                "pattern": lambda: random.uniform(0.96, 1.04),
-            },
-            "AWSLambda": {
-                "base": 45000,
-                "pattern": lambda: random.uniform(0.92, 1.08),
-            },
-            "AmazonGuardDuty": {
-                "base": 54000,
-                "pattern": lambda: random.uniform(0.97, 1.03),
-            },
-            "AWSSecurityHub": {
-                "base": 27000,
-                "pattern": lambda: random.uniform(0.98, 1.02),
-            },
-            "AWSCloudTrail": {
-                "base": 19500,
-                "pattern": lambda: random.uniform(0.96, 1.04),
-            },
-        }
+    # ========================================
+    # SECURITY ACCOUNT (555555555555)
+    # Security & compliance tooling, steady usage
+    # ========================================
+    services_security = {
+        "AmazonEC2": (84000, 0.98, 1.02),  # Very steady
+        "AmazonS3": (105000 + (month_num * 5000), 0.99, 1.01),  # Log storage, continuous growth
+        "AmazonCloudWatch": (66000, 0.96, 1.04),
+        "AWSLambda": (45000, 0.92, 1.08),
+        "AmazonGuardDuty": (54000, 0.97, 1.03),
+        "AWSSecurityHub": (27000, 0.98, 1.02),
+        "AWSCloudTrail": (19500, 0.96, 1.04),
+    }
 
-        # Combine all account services
-        all_account_services = [
-            ("111111111111", services_prod, "us-east-1"),
-            ("222222222222", services_staging, "us-west-2"),
-            ("333333333333", services_dev, "eu-west-1"),
-            ("444444444444", services_sandbox, "us-east-1"),
-            ("555555555555", services_security, "us-east-1"),
-        ]
+    # Combine all account services
+    all_account_services = [
+        ("111111111111", services_prod, "us-east-1"),
+        ("222222222222", services_staging, "us-west-2"),
+        ("333333333333", services_dev, "eu-west-1"),
+        ("444444444444", services_sandbox, "us-east-1"),
+        ("555555555555", services_security, "us-east-1"),
+    ]
 
-        # Generate records for all accounts and services
-        for account_id, services, primary_region in all_account_services:
-            for service_name, service_config in services.items():
-                base_cost = service_config["base"]
-                cost = base_cost * service_config["pattern"]()
-
-                # Randomly distribute some services across regions
-                if service_name in ["AmazonS3", "AWSLambda", "AmazonCloudFront"]:
-                    region = random.choice(regions)
-                else:
-                    region = primary_region
-
-                usage_cost = round(max(10.0, cost), 2)
-                data.append(
-                    {
-                        "line_item_usage_start_date": date,
-                        "line_item_usage_account_id": account_id,
-                        "line_item_product_code": service_name,
-                        "line_item_unblended_cost": usage_cost,
-                        "line_item_usage_type": f"{region}:{service_name}:Usage",
-                        "line_item_operation": (
-                            "RunInstances"
-                            if service_name in ["AmazonEC2", "AmazonEKS", "AmazonECS"]
-                            else "StandardStorage"
-                        ),
-                        "product_region": region,
-                        "line_item_resource_id": f'{service_name[6:9].lower()}-{hash(f"{date}{service_name}{account_id}") % 1000000:06d}',
-                        "line_item_line_item_type": "Usage",
-                    }
+    # One column per account/service, one row per month
+    account_ids, service_names, primary_regions, params = zip(
+        *(
+            (account_id, service_name, primary_region, service_params)
+            for account_id, services, primary_region in all_account_services
+            for service_name, service_params in services.items()
+        )
+    )
+    base_cost, low, high = (
+        np.column_stack([np.broadcast_to(p[i], month_num.shape) for p in params]) for i in range(3)
+    )
+
+    # Generate records for all accounts and services, month by month
+    n_months, n_services = base_cost.shape
+    service = np.tile(service_names, n_months)
+    cost = base_cost.ravel() * rng.uniform(low.ravel(), high.ravel())
+    usage_cost = np.maximum(10.0, cost).round(2)
+
+    # Randomly distribute some services across regions
+    region = np.where(
+        np.isin(service, ["AmazonS3", "AWSLambda", "AmazonCloudFront"]),
+        rng.choice(regions, size=service.size),
+        np.tile(primary_regions, n_months),
+    )
+
+    usage_date = np.repeat(dates.to_numpy(), n_services)
+    account_id = np.tile(account_ids, n_months)
+    usage = pl.DataFrame(
+        {
+            "line_item_usage_start_date": usage_date,
+            "line_item_usage_account_id": account_id,
+            "line_item_product_code": service,
+            "line_item_unblended_cost": usage_cost,
+            "product_region": region,
+        }
+    ).with_columns(
+        pl.col("line_item_usage_start_date").dt.cast_time_unit("us"),
+        # e.g. "ec2-012345": service prefix plus a hash of the date, service and account
+        line_item_resource_id=pl.concat_str(
+            [
+                pl.col("line_item_product_code").str.slice(6, 3).str.to_lowercase(),
+                (
+                    pl.struct(
+                        "line_item_usage_start_date",
+                        "line_item_product_code",
+                        "line_item_usage_account_id",
+                    ).hash(seed=42)
+                    % 1000000
                 )
-
-                # Add discount rows for some services (simulating Savings Plans, EDP, etc.)
-                if service_name in ["AmazonEC2", "AmazonRDS", "AmazonEKS"] and usage_cost > 100:
-                    # Calculate the on-demand equivalent (what it would cost without SP)
-                    on_demand_equivalent = round(usage_cost * 0.30, 2)  # 30% of usage covered by SP
-
-                    # Add SavingsPlanCoveredUsage (on-demand equivalent for tracking)
-                    data.append(
-                        {
-                            "line_item_usage_start_date": date,
-                            "line_item_usage_account_id": account_id,
-                            "line_item_product_code": service_name,
-                            "line_item_unblended_cost": on_demand_equivalent,
-                            "line_item_usage_type": f"{region}:{service_name}:SavingsPlanCoveredUsage",
-                            "line_item_operation": "SavingsPlanCoveredUsage",
-                            "product_region": region,
-                            "line_item_resource_id": "",
-                            "line_item_line_item_type": "SavingsPlanCoveredUsage",
-                        }
-                    )
-
-                    # Add SavingsPlanNegation (offsets the on-demand equivalent)
-                    discount_amount = -round(
-                        on_demand_equivalent * 0.50, 2
-                    )  # 50% savings on covered usage
-                    data.append(
-                        {
-                            "line_item_usage_start_date": date,
-                            "line_item_usage_account_id": account_id,
-                            "line_item_product_code": service_name,
-                            "line_item_unblended_cost": discount_amount,
-                            "line_item_usage_type": f"{region}:{service_name}:SavingsPlanNegation",
-                            "line_item_operation": "SavingsPlanNegation",
-                            "product_region": region,
-                            "line_item_resource_id": "",
-                            "line_item_line_item_type": "SavingsPlanNegation",
-                        }
-                    )
-
-                # Add EdpDiscount for larger services
-                if service_name in ["AmazonS3", "AmazonCloudFront"] and usage_cost > 50:
-                    edp_discount = -round(usage_cost * 0.05, 2)  # 5% EDP discount
-                    data.append(
-                        {
-                            "line_item_usage_start_date": date,
-                            "line_item_usage_account_id": account_id,
-                            "line_item_product_code": service_name,
-                            "line_item_unblended_cost": edp_discount,
-                            "line_item_usage_type": f"{region}:{service_name}:EdpDiscount",
-                            "line_item_operation": "EdpDiscount",
-                            "product_region": region,
-                            "line_item_resource_id": "",
-                            "line_item_line_item_type": "EdpDiscount",
-                        }
-                    )
-
-    return pl.DataFrame(data)
+                .cast(pl.String)
+                .str.zfill(6),
+            ],
+            separator="-",
+        ),
+    )
+
+    def line_items(frame, line_item_type, cost, operation=None):
+        """Fill in the usage type, operation and item type columns for a set of line items."""
+        return frame.with_columns(
+            line_item_unblended_cost=cost,
+            line_item_usage_type=pl.concat_str(
+                [
+                    pl.col("product_region"),
+                    pl.col("line_item_product_code"),
+                    pl.lit(line_item_type),
+                ],
+                separator=":",
+            ),
+            line_item_operation=operation if operation is not None else pl.lit(line_item_type),
+            line_item_line_item_type=pl.lit(line_item_type),
+        )
+
+    usage_items = line_items(
+        usage,
+        "Usage",
+        pl.col("line_item_unblended_cost"),
+        operation=pl.when(
+            pl.col("line_item_product_code").is_in(["AmazonEC2", "AmazonEKS", "AmazonECS"])
+        )
+        .then(pl.lit("RunInstances"))
+        .otherwise(pl.lit("StandardStorage")),
+    )
+
+    # Add discount rows for some services (simulating Savings Plans, EDP, etc.)
+    # Savings Plans cover 30% of usage (on-demand equivalent) at 50% savings
+    sp_usage = usage.filter(
+        pl.col("line_item_product_code").is_in(["AmazonEC2", "AmazonRDS", "AmazonEKS"])
+        & (pl.col("line_item_unblended_cost") > 100)
+    ).with_columns(
+        line_item_resource_id=pl.lit(""),
+        line_item_unblended_cost=(pl.col("line_item_unblended_cost") * 0.30).round(2),
+    )
+    sp_covered = line_items(sp_usage, "SavingsPlanCoveredUsage", pl.col("line_item_unblended_cost"))
+    sp_negation = line_items(
+        sp_usage, "SavingsPlanNegation", -(pl.col("line_item_unblended_cost") * 0.50).round(2)
+    )
+
+    # Add EdpDiscount for larger services (5% EDP discount)
+    edp_usage = usage.filter(
+        pl.col("line_item_product_code").is_in(["AmazonS3", "AmazonCloudFront"])
+        & (pl.col("line_item_unblended_cost") > 50)
+    ).with_columns(line_item_resource_id=pl.lit(""))
+    edp_discount = line_items(
+        edp_usage, "EdpDiscount", -(pl.col("line_item_unblended_cost") * 0.05).round(2)
+    )
+
+    return (
+        pl.concat([usage_items, sp_covered, sp_negation, edp_discount])
+        .sort("line_item_usage_start_date", maintain_order=True)
+        .select(
+            "line_item_usage_start_date",
+            "line_item_usage_account_id",
+            "line_item_product_code",
+            "line_item_unblended_cost",
+            "line_item_usage_type",
+            "line_item_operation",
+            "product_region",
+            "line_item_resource_id",
+            "line_item_line_item_type",
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def tiny_cur_data():
+    """Generate a minimal 3-record CUR frame for tests that never look at the data values."""
+    return pl.DataFrame(
+        {
+            "line_item_usage_start_date": [datetime(2024, 1, 1)] * 3,
+            "line_item_usage_account_id": ["111111111111", "111111111111", "222222222222"],
+            "line_item_product_code": ["AmazonEC2", "AmazonS3", "AmazonEC2"],
+            "line_item_unblended_cost": [350000.0, 125000.0, 135000.0],
+            "line_item_usage_type": [
+                "us-east-1:AmazonEC2:Usage",
+                "us-east-1:AmazonS3:Usage",
+                "us-west-2:AmazonEC2:Usage",
+            ],
+            "line_item_operation": ["RunInstances", "StandardStorage", "RunInstances"],
+            "product_region": ["us-east-1", "us-east-1", "us-west-2"],
+            "line_item_resource_id": ["ec2-000001", "s3-000002", "ec2-000003"],
+            "line_item_line_item_type": ["Usage"] * 3,
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cur_csv_content(sample_cur_data):
     """Generate CSV content from sample data."""
-    return sample_cur_data.to_pandas().to_csv(index=False).encode("utf-8")
+    return sample_cur_data.write_csv().encode("utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cur_csv_gz_content(sample_cur_csv_content):
-    """Generate gzipped CSV content."""
+    """Generate gzipped CSV content (fastest compression level; tests only decompress it)."""
+    return gzip.compress(sample_cur_csv_content, compresslevel=1)
+
+
+@pytest.fixture(scope="session")
+def sample_cur_parquet_content(sample_cur_data):
+    """Generate Parquet content from sample data, as written by Parquet CUR exports."""
     buffer = io.BytesIO()
-    with gzip.GzipFile(fileobj=buffer, mode="wb") as gz:
-        gz.write(sample_cur_csv_content)
+    sample_cur_data.write_parquet(buffer, compression="zstd", compression_level=1)
     return buffer.getvalue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_s3_objects():
-    """Generate mock S3 object list for 6 months of CUR exports."""
-    return [
+    """Generate mock S3 object list for 6 months of CUR exports (shared, read-only)."""
+    return (
         # January 2024 - available at end of January
         {
             "Key": "cur-reports/test-cur/20240101-20240201/test-cur-00001.csv.gz",
@@ -389,12 +348,12 @@ def mock_s3_objects():
             "LastModified": datetime(2024, 6, 30),
             "Size": 2048,
         },
-    ]
+    )
 
 
 @pytest.fixture
 def sample_aggregated_data():
-    """Generate sample aggregated data for testing processor outputs."""
+    """Generate sample aggregated data for testing processor outputs (fresh per test)."""
     return {
         "cost_by_service": pd.DataFrame(
             {
@@ -418,7 +377,7 @@ def temp_output_dir(tmp_path):
 
 @pytest.fixture
 def mock_env_vars(monkeypatch):
-    """Set mock environment variables for testing."""
+    """Set mock environment variables for one test, restoring them afterwards."""
     monkeypatch.setenv("CUR_BUCKET", "test-bucket")
     monkeypatch.setenv("CUR_PREFIX", "cur-reports/test-cur")
     monkeypatch.setenv("AWS_REGION", "us-east-1")
@@ -12,77 +12,107 @@ from click.testing import CliRunner
 # Add the parent directory to the path to import the main module
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from cur_report_generator import (
+    CURDataProcessor,
+    CURReader,
+    CURVisualizer,
+    generate_report,
+    setup_logging,
+)
+
 
 class TestCLI:
     """Test cases for CLI interface."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def runner(self):
-        """Create a CLI test runner."""
+        """Create a CLI test runner shared by all CLI tests."""
         return CliRunner()
 
+    @pytest.fixture(scope="session")
+    def prebuilt_mocks(self, tiny_cur_data):
+        """Build the configured reader, processor and visualizer mocks once per session."""
+        # Setup mock reader
+        mock_reader_instance = Mock(spec=CURReader)
+        mock_reader_instance.configure_mock(**{"load_cur_data.return_value": tiny_cur_data})
+
+        # Setup mock processor
+        mock_processor_instance = Mock(spec=CURDataProcessor)
+        mock_processor_instance.configure_mock(
+            **{
+                "prepare_data.return_value": tiny_cur_data,
+                "get_total_cost.return_value": 10000.0,
+                "get_cost_by_account_and_service.return_value": pd.DataFrame(),
+                "get_cost_trend_by_service.return_value": pd.DataFrame(),
+                "get_cost_trend_by_account.return_value": pd.DataFrame(),
+                "get_monthly_summary.return_value": pd.DataFrame(
+                    {
+                        "month": ["2024-01"],
+                        "total_cost": [10000.0],
+                        "avg_record_cost": [10.0],
+                        "num_records": [1000],
+                    }
+                ),
+                "detect_cost_anomalies.return_value": pd.DataFrame(),
+                "get_cost_trend_by_region.return_value": pd.DataFrame(),
+                "get_discounts_trend.return_value": pd.DataFrame(),
+                "get_discounts_by_service_trend.return_value": pd.DataFrame(),
+                "get_savings_plan_trend.return_value": pd.DataFrame(),
+                "get_savings_plan_summary.return_value": {
+                    "on_demand_equivalent": 0.0,
+                    "savings_plan_cost": 0.0,
+                    "total_savings": 0.0,
+                    "savings_percentage": 0.0,
+                },
+                "get_summary_statistics.return_value": {
+                    "total_cost": 10000.0,
+                    "num_accounts": 2,
+                    "num_services": 4,
+                    "date_range_start": "2024-01-01",
+                    "date_range_end": "2024-01-31",
+                    "total_records": 1000,
+                },
+            }
+        )
+
+        # Setup mock visualizer
+        mock_visualizer_instance = Mock(spec=CURVisualizer)
+        mock_visualizer_instance.configure_mock(
+            **{"write_reports.return_value": ["test_report.html"]}
+        )
+
+        return {
+            "reader": mock_reader_instance,
+            "processor": mock_processor_instance,
+            "visualizer": mock_visualizer_instance,
+        }
+
     @pytest.fixture
-    def mock_dependencies(self, sample_cur_data, sample_aggregated_data):
+    def mock_dependencies(self, prebuilt_mocks, sample_aggregated_data):
         """Mock all external dependencies for CLI tests."""
+        # Start every test from a clean call history; configured return values are kept
+        for instance in prebuilt_mocks.values():
+            instance.reset_mock()
+        # Hand each test its own aggregated frames so in-place edits cannot leak between tests
+        prebuilt_mocks["processor"].configure_mock(
+            **{
+                "get_cost_by_service.return_value": sample_aggregated_data["cost_by_service"],
+                "get_cost_by_account.return_value": sample_aggregated_data["cost_by_account"],
+            }
+        )
+
         with (
             patch("cur_report_generator.load_dotenv"),
-            patch("cur_report_generator.CURReader") as mock_reader,
-            patch("cur_report_generator.CURDataProcessor") as mock_processor,
-            patch("cur_report_generator.CURVisualizer") as mock_visualizer,
+            patch(
+                "cur_report_generator.CURReader", return_value=prebuilt_mocks["reader"]
+            ) as mock_reader,
+            patch(
+                "cur_report_generator.CURDataProcessor", return_value=prebuilt_mocks["processor"]
+            ) as mock_processor,
+            patch(
+                "cur_report_generator.CURVisualizer", return_value=prebuilt_mocks["visualizer"]
+            ) as mock_visualizer,
         ):
-
-            # Setup mock reader
-            mock_reader_instance = Mock()
-            mock_reader_instance.load_cur_data.return_value = sample_cur_data
-            mock_reader.return_value = mock_reader_instance
-
-            # Setup mock processor
-            mock_processor_instance = Mock()
-            mock_processor_instance.prepare_data.return_value = sample_cur_data
-            mock_processor_instance.get_total_cost.return_value = 10000.0
-            mock_processor_instance.get_cost_by_service.return_value = sample_aggregated_data[
-                "cost_by_service"
-            ]
-            mock_processor_instance.get_cost_by_account.return_value = sample_aggregated_data[
-                "cost_by_account"
-            ]
-            mock_processor_instance.get_cost_by_account_and_service.return_value = pd.DataFrame()
-            mock_processor_instance.get_cost_trend_by_service.return_value = pd.DataFrame()
-            mock_processor_instance.get_cost_trend_by_account.return_value = pd.DataFrame()
-            mock_processor_instance.get_monthly_summary.return_value = pd.DataFrame(
-                {
-                    "month": ["2024-01"],
-                    "total_cost": [10000.0],
-                    "avg_record_cost": [10.0],
-                    "num_records": [1000],
-                }
-            )
-            mock_processor_instance.detect_cost_anomalies.return_value = pd.DataFrame()
-            mock_processor_instance.get_cost_trend_by_region.return_value = pd.DataFrame()
-            mock_processor_instance.get_discounts_trend.return_value = pd.DataFrame()
-            mock_processor_instance.get_discounts_by_service_trend.return_value = pd.DataFrame()
-            mock_processor_instance.get_savings_plan_trend.return_value = pd.DataFrame()
-            mock_processor_instance.get_savings_plan_summary.return_value = {
-                "on_demand_equivalent": 0.0,
-                "savings_plan_cost": 0.0,
-                "total_savings": 0.0,
-                "savings_percentage": 0.0,
-            }
-            mock_processor_instance.get_summary_statistics.return_value = {
-                "total_cost": 10000.0,
-                "num_accounts": 2,
-                "num_services": 4,
-                "date_range_start": "2024-01-01",
-                "date_range_end": "2024-01-31",
-                "total_records": 1000,
-            }
-            mock_processor.return_value = mock_processor_instance
-
-            # Setup mock visualizer
-            mock_visualizer_instance = Mock()
-            mock_visualizer_instance.generate_html_report.return_value = "test_report.html"
-            mock_visualizer.return_value = mock_visualizer_instance
-
             yield {
                 "reader": mock_reader,
                 "processor": mock_processor,
@@ -91,106 +121,92 @@ class TestCLI:
 
     def test_help_command(self, runner):
         """Test --help flag."""
-        from cur_report_generator import generate_report
-
         result = runner.invoke(generate_report, ["--help"])
 
         assert result.exit_code == 0
         assert "Generate comprehensive AWS Cost and Usage Reports" in result.output
 
-    def test_basic_execution(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_basic_execution(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test basic CLI execution with mocked dependencies."""
-        from cur_report_generator import generate_report
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
+        # With mocked dependencies, should complete successfully
+        assert result.exit_code == 0
+        write_reports = mock_dependencies["visualizer"].return_value.write_reports
+        write_reports.assert_called_once()
+        reports, output_dir = write_reports.call_args.args
+        assert output_dir == "test_reports"
+        assert len(reports) == 1
+
+    def test_custom_date_range(
+        self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch
+    ):
+        """Test CLI with custom date range."""
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            generate_report,
+            [
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-01-31",
+                "--output-dir",
+                "test_reports",
+            ],
+        )
 
-            # With mocked dependencies, should complete successfully
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_custom_date_range(self, runner, mock_env_vars, mock_dependencies, tmp_path):
-        """Test CLI with custom date range."""
-        from cur_report_generator import generate_report
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                generate_report,
-                [
-                    "--start-date",
-                    "2024-01-01",
-                    "--end-date",
-                    "2024-01-31",
-                    "--output-dir",
-                    "test_reports",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_sample_files_option(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_sample_files_option(
+        self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch
+    ):
         """Test --sample-files option."""
-        from cur_report_generator import generate_report
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            generate_report, ["--sample-files", "5", "--output-dir", "test_reports"]
+        )
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                generate_report, ["--sample-files", "5", "--output-dir", "test_reports"]
-            )
-
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_csv_generation(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_csv_generation(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test CSV generation option."""
-        from cur_report_generator import generate_report
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                generate_report, ["--generate-csv", "--output-dir", "test_reports"]
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--generate-csv", "--output-dir", "test_reports"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_top_n_option(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_top_n_option(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test --top-n option."""
-        from cur_report_generator import generate_report
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                generate_report, ["--top-n", "20", "--output-dir", "test_reports"]
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--top-n", "20", "--output-dir", "test_reports"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
     def test_invalid_date_format(self, runner, mock_env_vars):
         """Test error handling for invalid date format."""
-        from cur_report_generator import generate_report
-
         result = runner.invoke(generate_report, ["--start-date", "invalid-date"])
 
         assert result.exit_code == 1
         assert "Invalid date format" in result.output
 
-    def test_no_html_option(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_no_html_option(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test --no-html option."""
-        from cur_report_generator import generate_report
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(generate_report, ["--no-html", "--output-dir", "test_reports"])
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--no-html", "--output-dir", "test_reports"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
+        mock_dependencies["visualizer"].return_value.write_reports.assert_not_called()
 
-    def test_debug_mode(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_debug_mode(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test --debug flag."""
-        from cur_report_generator import generate_report
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--debug", "--output-dir", "test_reports"])
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(generate_report, ["--debug", "--output-dir", "test_reports"])
-
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_empty_data_handling(self, runner, mock_env_vars, tmp_path):
+    def test_empty_data_handling(self, runner, mock_env_vars, tmp_path, monkeypatch):
         """Test handling when no CUR data is found."""
-        from cur_report_generator import generate_report
-
         with (
             patch("cur_report_generator.load_dotenv"),
             patch("cur_report_generator.CURReader") as mock_reader,
@@ -201,41 +217,37 @@ class TestCLI:
             mock_reader_instance.load_cur_data.return_value = pl.DataFrame()
             mock_reader.return_value = mock_reader_instance
 
-            with runner.isolated_filesystem(temp_dir=tmp_path):
-                result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
+            monkeypatch.chdir(tmp_path)
+            result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
 
-                assert result.exit_code == 1
-                assert "No CUR data found" in result.output
+            assert result.exit_code == 1
+            assert "No CUR data found" in result.output
 
-    def test_output_directory_creation(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_output_directory_creation(
+        self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch
+    ):
         """Test that output directory is created if it doesn't exist."""
-        from cur_report_generator import generate_report
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            output_dir = "nested/test/reports"
-            result = runner.invoke(generate_report, ["--output-dir", output_dir])
+        monkeypatch.chdir(tmp_path)
+        output_dir = "nested/test/reports"
+        result = runner.invoke(generate_report, ["--output-dir", output_dir])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_banner_display(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_banner_display(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test that banner is displayed."""
-        from cur_report_generator import generate_report
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
 
-            assert "AWS Cost and Usage Report Generator" in result.output
+        assert "AWS Cost and Usage Report Generator" in result.output
 
-    def test_summary_output(self, runner, mock_env_vars, mock_dependencies, tmp_path):
+    def test_summary_output(self, runner, mock_env_vars, mock_dependencies, tmp_path, monkeypatch):
         """Test that summary is displayed in output."""
-        from cur_report_generator import generate_report
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(generate_report, ["--output-dir", "test_reports"])
-
-            assert result.exit_code == 0
-            assert "Report Summary" in result.output
-            assert "Usage Cost" in result.output
+        assert result.exit_code == 0
+        assert "Report Summary" in result.output
+        assert "Usage Cost" in result.output
 
 
 class TestSetupLogging:
@@ -243,14 +255,10 @@ class TestSetupLogging:
 
     def test_setup_logging_info_level(self):
         """Test logging setup with info level."""
-        from cur_report_generator import setup_logging
-
         setup_logging(debug=False)
         # Just ensure it doesn't crash
 
     def test_setup_logging_debug_level(self):
         """Test logging setup with debug level."""
-        from cur_report_generator import setup_logging
-
         setup_logging(debug=True)
         # Just ensure it doesn't crash
@@ -178,6 +178,34 @@ class TestCURReader:
             # With sample_files=2, we scan each file individually (2 files)
             assert mock_scan_csv.call_count == 2
 
+    def test_load_cur_data_parquet_from_cache(
+        self, sample_cur_data, sample_cur_parquet_content, tmp_path
+    ):
+        """Test loading Parquet CUR exports served from the local cache."""
+        parquet_key = "cur-reports/test-cur/20240101-20240201/test-cur-00001.parquet"
+
+        with patch("s3_reader.boto3.Session") as mock_session:
+            mock_client = Mock()
+            mock_paginator = Mock()
+
+            mock_paginator.paginate.return_value = [
+                {"Contents": [{"Key": parquet_key, "LastModified": datetime(2024, 1, 31)}]}
+            ]
+            mock_client.get_paginator.return_value = mock_paginator
+            mock_session.return_value.client.return_value = mock_client
+
+            reader = CURReader(bucket="test-bucket", prefix="test-prefix", cache_dir=str(tmp_path))
+            # January 2024 is a closed month, so the cached copy is read without downloading
+            reader._get_cache_path(parquet_key).write_bytes(sample_cur_parquet_content)
+
+            df = reader.load_cur_data(
+                start_date=datetime(2024, 1, 1), end_date=datetime(2024, 7, 31)
+            )
+
+            assert isinstance(df, pl.DataFrame)
+            assert len(df) == len(sample_cur_data)
+            mock_client.download_file.assert_not_called()
+
     def test_load_cur_data_no_files(self):
         """Test loading CUR data when no files are found."""
         with patch("s3_reader.boto3.Session") as mock_session:
@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 
 import pandas as pd
+import pytest
 from pyecharts.charts import Bar, HeatMap, Scatter
 from pyecharts.globals import ThemeType
 
@@ -45,6 +46,17 @@ class TestCURVisualizer:
         assert chart is not None
         assert isinstance(chart, Bar)
 
+    def test_create_service_trend_chart_empty(self):
+        """Test service trend chart with empty data."""
+        df = pd.DataFrame()
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_service_trend_chart(df)
+
+        assert chart is not None
+        assert isinstance(chart, Bar)
+        assert visualizer.charts[0][0] == "service_trend"
+
     def test_create_account_trend_chart(self):
         """Test creation of account trend chart."""
         df = pd.DataFrame(
@@ -77,6 +89,72 @@ class TestCURVisualizer:
         assert chart is not None
         assert isinstance(chart, HeatMap)
 
+    def test_create_account_service_heatmap_empty(self):
+        """Test account-service heatmap with empty data."""
+        df = pd.DataFrame()
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_account_service_heatmap(df)
+
+        assert chart is not None
+        assert isinstance(chart, HeatMap)
+
+    def test_create_account_service_heatmap_duplicate_pairs(self):
+        """Test that repeated account-service pairs are summed into one cell."""
+        df = pd.DataFrame(
+            {
+                "account_id": ["123456789012", "123456789012", "210987654321"],
+                "service": ["AmazonEC2", "AmazonEC2", "AmazonS3"],
+                "total_cost": [1000.0, 250.0, 800.0],
+            }
+        )
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_account_service_heatmap(df)
+
+        data = chart.options["series"][0]["data"]
+        assert [0, 0, 1250.0] in data
+        assert [1, 1, 800.0] in data
+
+    def test_create_account_service_heatmap_omits_empty_cells(self):
+        """Test that account-service pairs without cost are left out of the heatmap data."""
+        df = pd.DataFrame(
+            {
+                "account_id": ["123456789012", "210987654321"],
+                "service": ["AmazonEC2", "AmazonS3"],
+                "total_cost": [1000.0, 800.0],
+            }
+        )
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_account_service_heatmap(df)
+
+        assert chart.options["series"][0]["data"] == [[0, 0, 1000.0], [1, 1, 800.0]]
+
+    def test_create_account_service_heatmap_all_zero_row(self):
+        """Test that an account with no spend keeps its row, drawn in the $0 colour."""
+        df = pd.DataFrame(
+            {
+                "account_id": ["123456789012", "210987654321", "210987654321"],
+                "service": ["AmazonEC2", "AmazonEC2", "AmazonS3"],
+                "total_cost": [1000.0, 0.0, 0.0],
+            }
+        )
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_account_service_heatmap(df)
+
+        yaxis = chart.options["yAxis"][0]
+        assert yaxis["data"] == ["123456789012", "210987654321"]
+        assert chart.options["series"][0]["data"] == [[0, 0, 1000.0]]
+
+        # Cells without data show the grid background, which matches the visual map's $0 end
+        visual_map = chart.options["visualMap"].opts
+        assert visual_map["min"] == 0
+        split_area = yaxis["splitArea"].opts
+        assert split_area["show"] is True
+        assert split_area["areaStyle"].opts["color"] == visual_map["inRange"]["color"][0]
+
     def test_create_monthly_summary_chart(self):
         """Test creation of monthly summary chart."""
         df = pd.DataFrame(
@@ -108,6 +186,47 @@ class TestCURVisualizer:
         assert chart is not None
         assert isinstance(chart, Scatter)
 
+    def test_create_anomaly_chart_caps_points_per_service(self, monkeypatch):
+        """Test that only the largest deviations are drawn for very large services."""
+        monkeypatch.setattr("visualizer._ANOMALY_MAX_POINTS", 2)
+        df = pd.DataFrame(
+            {
+                "month": ["2024-01", "2024-02", "2024-03", "2024-04"],
+                "service": ["AmazonEC2"] * 4,
+                "total_cost": [1000.0, 5000.0, 100.0, 3000.0],
+                "mean_cost": [2000.0] * 4,
+                "z_score": [0.5, 3.5, -2.8, 1.0],
+                "pct_change": [-50.0, 150.0, -95.0, 50.0],
+            }
+        )
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_anomaly_chart(df)
+
+        points = chart.options["series"][0]["data"]
+        assert [point["value"][0] for point in points] == ["2024-02", "2024-03"]
+
+    def test_create_anomaly_chart_caps_points_with_duplicate_index(self, monkeypatch):
+        """Test that the point cap holds when the input index has duplicate labels."""
+        monkeypatch.setattr("visualizer._ANOMALY_MAX_POINTS", 2)
+        df = pd.DataFrame(
+            {
+                "month": ["2024-01", "2024-02", "2024-03", "2024-04"],
+                "service": ["AmazonEC2"] * 4,
+                "total_cost": [1000.0, 5000.0, 100.0, 3000.0],
+                "mean_cost": [2000.0] * 4,
+                "z_score": [0.5, 3.5, -2.8, 1.0],
+                "pct_change": [-50.0, 150.0, -95.0, 50.0],
+            },
+            index=[0, 0, 1, 1],
+        )
+
+        visualizer = CURVisualizer()
+        chart = visualizer.create_anomaly_chart(df)
+
+        points = chart.options["series"][0]["data"]
+        assert [point["value"][0] for point in points] == ["2024-02", "2024-03"]
+
     def test_create_anomaly_chart_empty(self):
         """Test creation of anomaly chart with empty data."""
         df = pd.DataFrame()
@@ -181,6 +300,104 @@ class TestCURVisualizer:
 
         assert Path(output_path).exists()
 
+    def test_generate_html_report_escapes_unsafe_dates(self, temp_output_dir):
+        """Test that only non-plain summary values are HTML-escaped."""
+        visualizer = CURVisualizer()
+
+        summary_stats = {
+            "total_cost": 0.0,
+            "num_accounts": 0,
+            "num_services": 0,
+            "date_range_start": "2024-01-01 00:00:00",
+            "date_range_end": "<script>alert(1)</script>",
+            "total_records": 0,
+        }
+
+        output_path = temp_output_dir / "escaped_report.html"
+        visualizer.generate_html_report(str(output_path), summary_stats)
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            html_content = f.read()
+
+        assert "2024-01-01 00:00:00<br>to<br>" in html_content
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html_content
+        assert "<script>alert(1)</script>" not in html_content
+
+    def test_write_reports(self, temp_output_dir):
+        """Test batch writing of several reports sharing the same charts."""
+        visualizer = CURVisualizer()
+
+        monthly_summary = pd.DataFrame(
+            {"month": ["2024-01", "2024-02"], "total_cost": [150.0, 180.0]}
+        )
+        visualizer.create_monthly_summary_chart(monthly_summary)
+
+        summary_stats = {
+            "total_cost": 330.0,
+            "num_accounts": 1,
+            "num_services": 1,
+            "date_range_start": "2024-01-01",
+            "date_range_end": "2024-02-29",
+            "total_records": 10,
+        }
+
+        paths = visualizer.write_reports(
+            [
+                ("first.html", summary_stats, "First Report"),
+                ("second.html", summary_stats, "Second Report"),
+            ],
+            str(temp_output_dir / "batch"),
+        )
+
+        assert len(paths) == 2
+        for path, title in zip(paths, ["First Report", "Second Report"]):
+            with open(path, "r", encoding="utf-8") as f:
+                html_content = f.read()
+            assert title in html_content
+            assert "echarts.init(" in html_content
+
+    @pytest.mark.parametrize("filename", ["../escaped.html", "nested/report.html", "/tmp/x.html"])
+    def test_write_reports_rejects_paths_outside_output_dir(self, temp_output_dir, filename):
+        """Test that report filenames cannot escape the output directory."""
+        visualizer = CURVisualizer()
+
+        with pytest.raises(ValueError, match="plain file name"):
+            visualizer.write_reports([(filename, {}, "Report")], str(temp_output_dir / "batch"))
+
+        assert not (temp_output_dir / "escaped.html").exists()
+
+    def test_generate_html_report_releases_charts(self, temp_output_dir):
+        """Test that charts are released after rendering when keep_charts is False."""
+        visualizer = CURVisualizer(keep_charts=False)
+
+        monthly_summary = pd.DataFrame(
+            {"month": ["2024-01", "2024-02"], "total_cost": [150.0, 180.0]}
+        )
+        visualizer.create_monthly_summary_chart(monthly_summary)
+        assert len(visualizer.charts) == 1
+
+        output_path = temp_output_dir / "released_report.html"
+        visualizer.generate_html_report(str(output_path), {"total_cost": 330.0})
+
+        assert visualizer.charts == []
+        with open(output_path, "r", encoding="utf-8") as f:
+            assert "echarts.init(" in f.read()
+
+    def test_failed_write_keeps_charts(self, temp_output_dir):
+        """Test that a one-shot visualizer keeps its charts when the report cannot be written."""
+        visualizer = CURVisualizer(keep_charts=False)
+
+        monthly_summary = pd.DataFrame(
+            {"month": ["2024-01", "2024-02"], "total_cost": [150.0, 180.0]}
+        )
+        visualizer.create_monthly_summary_chart(monthly_summary)
+
+        # The output path is an existing directory, so opening it for writing fails
+        with pytest.raises(OSError):
+            visualizer.generate_html_report(str(temp_output_dir), {"total_cost": 330.0})
+
+        assert len(visualizer.charts) == 1
+
     def test_multiple_charts_accumulation(self):
         """Test that multiple charts are accumulated correctly."""
         visualizer = CURVisualizer()